@@ -57,11 +57,13 @@ def _calculate_profitability_metrics(np: float | None, op: float | None, eq: flo
 logger = logging.getLogger(__name__)
 
 
-def _filter_annual_data(annual_data: list[dict[str, Any]], analysis_years: int) -> list[dict[str, Any]]:
+def _filter_annual_data(
+    annual_data: list[dict[str, Any]],
+    analysis_years: int,
+    today: datetime,
+) -> list[dict[str, Any]]:
     """年数上限・未来日付除外・重複排除・バリデーションを適用してデータを絞り込む"""
-    today = datetime.now()
-    current_year = today.year
-    current_month = today.month
+    current_year_month = (today.year, today.month)
 
     years_data = []
     seen_entries = set()
@@ -80,9 +82,7 @@ def _filter_annual_data(annual_data: list[dict[str, Any]], analysis_years: int)
         # 未来の年度データを除外
         try:
             y, m = extract_year_month(fy_end)
-            if y is not None and m is not None and (
-                y > current_year or (y == current_year and m > current_month)
-            ):
+            if y is not None and m is not None and (y, m) > current_year_month:
                 continue
         except (ValueError, IndexError):
             pass
@@ -109,45 +109,85 @@ def _filter_annual_data(annual_data: list[dict[str, Any]], analysis_years: int)
     return years_data
 
 
+# RawData に float 化して格納するフィールド（CashEq のフォールバック元を含む）
+_RAW_FLOAT_FIELDS = (
+    "Sales",
+    "OP",
+    "NP",
+    "NetAssets",
+    "CFO",
+    "CFI",
+    "EPS",
+    "BPS",
+    "ShOutFY",
+    "AverageShares",
+    "TreasuryShares",
+    "SharesForBPS",
+    "ParentEquity",
+    "StockSplitRatio",
+    "CumulativeStockSplitRatio",
+    "CalculatedEPS",
+    "CalculatedBPS",
+    "EPSDirectDiff",
+    "BPSDirectDiff",
+    "DivTotalAnn",
+    "PayoutRatioAnn",
+    "CashAndCashEquivalents",
+    "CashEq",
+    "Cash",
+    "Div2Q",
+    "DivAnn",
+)
+
+# 現金同等物のフォールバック順
+_CASH_EQ_FIELDS = ("CashAndCashEquivalents", "CashEq", "Cash")
+
+
+def _extract_floats(year_data: dict[str, Any], keys: Sequence[str]) -> dict[str, float | None]:
+    """指定フィールドを1回ずつ float に変換して返す"""
+    return {k: to_float(year_data.get(k)) for k in keys}
+
+
 def _extract_raw_values(year_data: dict[str, Any]) -> RawData:
     """年度データから生値を抽出する"""
     shareholder_metric_sources = year_data.get("ShareholderMetricSources")
     stock_split_events = year_data.get("StockSplitEvents")
+    raw = _extract_floats(year_data, _RAW_FLOAT_FIELDS)
     return {
         'CurPerType': year_data.get("CurPerType", ""),
         'CurFYSt': year_data.get("CurFYSt", ""),
         'CurFYEn': year_data.get("CurFYEn"),
         'DiscDate': year_data.get("DiscDate", ""),
         'SalesLabel': year_data.get("SalesLabel"),
-        'Sales': to_float(year_data.get("Sales")),
-        'OP': to_float(year_data.get("OP")),
-        'NP': to_float(year_data.get("NP")),
-        'NetAssets': to_float(year_data.get("NetAssets")),
-        'CFO': to_float(year_data.get("CFO")),
-        'CFI': to_float(year_data.get("CFI")),
-        'EPS': to_float(year_data.get("EPS")),
-        'BPS': to_float(year_data.get("BPS")),
-        'ShOutFY': to_float(year_data.get("ShOutFY")),
-        'AverageShares': to_float(year_data.get("AverageShares")),
-        'TreasuryShares': to_float(year_data.get("TreasuryShares")),
-        'SharesForBPS': to_float(year_data.get("SharesForBPS")),
-        'ParentEquity': to_float(year_data.get("ParentEquity")),
-        'StockSplitRatio': to_float(year_data.get("StockSplitRatio")),
-        'CumulativeStockSplitRatio': to_float(year_data.get("CumulativeStockSplitRatio")),
+        'Sales': raw['Sales'],
+        'OP': raw['OP'],
+        'NP': raw['NP'],
+        'NetAssets': raw['NetAssets'],
+        'CFO': raw['CFO'],
+        'CFI': raw['CFI'],
+        'EPS': raw['EPS'],
+        'BPS': raw['BPS'],
+        'ShOutFY': raw['ShOutFY'],
+        'AverageShares': raw['AverageShares'],
+        'TreasuryShares': raw['TreasuryShares'],
+        'SharesForBPS': raw['SharesForBPS'],
+        'ParentEquity': raw['ParentEquity'],
+        'StockSplitRatio': raw['StockSplitRatio'],
+        'CumulativeStockSplitRatio': raw['CumulativeStockSplitRatio'],
         'StockSplitEvents': (
             cast(list[StockSplitEvent], stock_split_events)
             if isinstance(stock_split_events, list)
             else []
         ),
-        'CalculatedEPS': to_float(year_data.get("CalculatedEPS")),
-        'CalculatedBPS': to_float(year_data.get("CalculatedBPS")),
-        'EPSDirectDiff': to_float(year_data.get("EPSDirectDiff")),
-        'BPSDirectDiff': to_float(year_data.get("BPSDirectDiff")),
-        'DivTotalAnn': to_float(year_data.get("DivTotalAnn")),
-        'PayoutRatioAnn': to_float(year_data.get("PayoutRatioAnn")),
-        'CashEq': to_float(year_data.get("CashAndCashEquivalents")) or to_float(year_data.get("CashEq")) or to_float(year_data.get("Cash")),
-        'Div2Q': to_float(year_data.get("Div2Q")),
-        'DivAnn': to_float(year_data.get("DivAnn")),
+        'CalculatedEPS': raw['CalculatedEPS'],
+        'CalculatedBPS': raw['CalculatedBPS'],
+        'EPSDirectDiff': raw['EPSDirectDiff'],
+        'BPSDirectDiff': raw['BPSDirectDiff'],
+        'DivTotalAnn': raw['DivTotalAnn'],
+        'PayoutRatioAnn': raw['PayoutRatioAnn'],
+        'CashEq': next((v for v in (raw[k] for k in _CASH_EQ_FIELDS) if v is not None), None),
+        'Div2Q': raw['Div2Q'],
+        'DivAnn': raw['DivAnn'],
         'ShareholderMetricSources': (
             cast(dict[str, MetricSource], shareholder_metric_sources)
             if isinstance(shareholder_metric_sources, dict)
@@ -341,8 +381,9 @@ def _calculate_base_values(raw_values: RawData) -> CalculatedData:
     }
     sales_label = raw_values.get("SalesLabel")
     if isinstance(sales_label, str) and sales_label:
-        values["MetricSources"]["Sales"]["label"] = sales_label
-        values["MetricSources"]["Sales"]["source"] = "edinet"
+        sales_source = values["MetricSources"]["Sales"]
+        sales_source["label"] = sales_label
+        sales_source["source"] = "edinet"
     _add_per_share_calculation_values(values, raw_values, base_source)
     return values
 
@@ -367,27 +408,24 @@ def _build_year_entry(year_data: dict[str, Any]) -> YearEntry:
     raw_values = _extract_raw_values(year_data)
     calc_values = _calculate_base_values(raw_values)
 
-    # 収益性指標
-    profit_metrics = _calculate_profitability_metrics(
-        raw_metric_millions(raw_values, "NP"),
-        raw_metric_millions(raw_values, "OP"),
-        raw_metric_millions(raw_values, "NetAssets"),
-        raw_metric_millions(raw_values, "CFO"),
-    )
-    calc_values.update({
-        'ROE': profit_metrics['roe'],
-        'CFCVR': profit_metrics['cf_conversion_rate']
-    })
-    metric_sources = calc_values.get("MetricSources") or {}
-    metric_sources.update({
-        "ROE": {"source": "derived", "method": "NP / NetAssets", "unit": "percent"},
-        "CFCVR": {"source": "derived", "method": "CFO / NP", "unit": "percent"},
-    })
-    calc_values["MetricSources"] = metric_sources
-
-    # 2Qは6ヶ月分のEPS/BPSのため、比率系指標は無効
+    # 2Qは6ヶ月分のEPS/BPSのため、比率系指標は無効（計算自体を省く）
     if per_type == "2Q":
-        calc_values.update({'ROE': None, 'CFCVR': None})
+        calc_values['ROE'] = None
+        calc_values['CFCVR'] = None
+    else:
+        # 収益性指標
+        profit_metrics = _calculate_profitability_metrics(
+            raw_metric_millions(raw_values, "NP"),
+            raw_metric_millions(raw_values, "OP"),
+            raw_metric_millions(raw_values, "NetAssets"),
+            raw_metric_millions(raw_values, "CFO"),
+        )
+        calc_values['ROE'] = profit_metrics['roe']
+        calc_values['CFCVR'] = profit_metrics['cf_conversion_rate']
+    # MetricSources は _calculate_base_values で必ず設定済み
+    metric_sources = calc_values.setdefault("MetricSources", {})
+    metric_sources["ROE"] = {"source": "derived", "method": "NP / NetAssets", "unit": "percent"}
+    metric_sources["CFCVR"] = {"source": "derived", "method": "CFO / NP", "unit": "percent"}
 
     return {
         "fy_end": fy_end,
@@ -411,10 +449,14 @@ def _assemble_summary(metrics: MetricsResult, years_metrics: Sequence[YearEntry]
 
 def calculate_metrics_flexible(
     annual_data: list[dict[str, Any]],
-    analysis_years: int | None = None
+    analysis_years: int | None = None,
+    today: datetime | None = None,
 ) -> MetricsResult:
     """
     年度データから各種指標を計算（柔軟な年数対応）
+
+    today は未来年度の除外に使う基準日。複数銘柄を連続計算する呼び出し元は
+    同じ値を渡して現在時刻の取得を1回にまとめられる（省略時は現在日時）。
     """
     if not annual_data:
         return {}
@@ -422,7 +464,10 @@ def calculate_metrics_flexible(
     if analysis_years is None:
         analysis_years = len(annual_data)
 
-    years_data = _filter_annual_data(annual_data, analysis_years)
+    if today is None:
+        today = datetime.now()
+
+    years_data = _filter_annual_data(annual_data, analysis_years, today)
     if not years_data:
         return {}
 
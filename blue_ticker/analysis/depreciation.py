@@ -33,6 +33,9 @@ from blue_ticker.constants.xbrl import (
 from blue_ticker.utils.xbrl_result_types import DepreciationResult
 
 
+_PERIOD_HEADING_RE = re.compile(r"第\d+期")
+
+
 def _extract_usgaap_da_from_html(xbrl_dir: Path) -> DepreciationResult | None:
     """US-GAAP企業の連結CF計算書(0105010)HTMLから減価償却費を抽出する。"""
     if not _BS4_AVAILABLE:
@@ -77,7 +80,7 @@ def _extract_usgaap_da_from_html(xbrl_dir: Path) -> DepreciationResult | None:
                     current_col_idx = last_col
                 elif "前連結" in text or "前期" in text:
                     prior_col_idx = last_col
-                elif re.search(r"第\d+期", text):
+                elif _PERIOD_HEADING_RE.search(text):
                     if prior_col_idx is None:
                         prior_col_idx = col_offset
                     else:
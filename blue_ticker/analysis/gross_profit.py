@@ -47,6 +47,9 @@ from blue_ticker.constants.xbrl import (
 from blue_ticker.utils.xbrl_result_types import GrossProfitResult, MetricComponent
 
 
+_PERIOD_HEADING_RE = re.compile(r"第\d+期")
+
+
 def _resolve_prefer_both(
     section: IncomeStatementSection, tags: list[str]
 ) -> tuple[float | None, float | None]:
@@ -211,7 +214,7 @@ def _extract_usgaap_gp_from_html(xbrl_dir: Path) -> GrossProfitResult | None:
                     current_col_idx = last_col
                 elif "前連結" in text or "前期" in text:
                     prior_col_idx = last_col
-                elif re.search(r"第\d+期", text):
+                elif _PERIOD_HEADING_RE.search(text):
                     # 「第N期」形式: colspan 内の先頭列（金額列）を使う。出現順に前期→当期。
                     if prior_col_idx is None:
                         prior_col_idx = col_offset
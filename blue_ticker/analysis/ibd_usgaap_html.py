@@ -20,6 +20,9 @@ from blue_ticker.constants.xbrl import COMPONENT_DEFINITIONS
 from blue_ticker.utils.xbrl_result_types import InterestBearingDebtResult, MetricComponent
 
 
+_PERIOD_NUMBER_RE = re.compile(r'第(\d+)期')
+
+
 def _safe_sum(vals: list[float | None]) -> float | None:
     vs = [v for v in vals if v is not None]
     return sum(vs) if vs else None
@@ -34,7 +37,7 @@ def _determine_column_order(headers: list[str]) -> tuple[int | None, int]:
     """
     period_nums = []
     for h in headers:
-        m = re.search(r'第(\d+)期', h)
+        m = _PERIOD_NUMBER_RE.search(h)
         period_nums.append(int(m.group(1)) if m else -1)
 
     if any(n >= 0 for n in period_nums):
@@ -92,6 +95,7 @@ def _parse_loan_tables(tables: list) -> dict[str, tuple[float | None, float | No
             if not row or len(row) < 2:
                 continue
             label = row[0]
+            bare_label = label.removesuffix("\n")  # 完全一致判定用（末尾の改行1つは無視）
             vals = row[1:]
 
             def _get(idx, _vals=vals):
@@ -103,7 +107,7 @@ def _parse_loan_tables(tables: list) -> dict[str, tuple[float | None, float | No
                 short_term_current = short_term_current or _get(current_idx)
                 short_term_prior   = short_term_prior   or _get(prior_idx)
 
-            elif re.match(r'^長期借入金$', label):
+            elif bare_label == "長期借入金":
                 lt_total_current = lt_total_current or _get(current_idx)
                 lt_total_prior   = lt_total_prior   or _get(prior_idx)
 
@@ -115,11 +119,11 @@ def _parse_loan_tables(tables: list) -> dict[str, tuple[float | None, float | No
                 bonds_current = bonds_current or _get(current_idx)
                 bonds_prior   = bonds_prior   or _get(prior_idx)
 
-            elif re.match(r'^合計$', label):
+            elif bare_label == "合計":
                 st_total_current = st_total_current or _get(current_idx)
                 st_total_prior   = st_total_prior   or _get(prior_idx)
 
-            elif re.match(r'^差引計$', label):
+            elif bare_label == "差引計":
                 lt_net_current = lt_net_current or _get(current_idx)
                 lt_net_prior   = lt_net_prior   or _get(prior_idx)
 
@@ -175,6 +175,7 @@ _JAPANESE_DATE_RE = re.compile(
 _PARTIAL_EFFECTIVE_DATE_RE = re.compile(
     r"([0-9]{1,2})月\s*([0-9]{1,2})日\s*を効力発生日"
 )
+_SENTENCE_BREAK_RE = re.compile(r"(?<=。)|(?<=\.)|\n")
 
 MetricSourcePayload = dict[str, str | float | None]
 ShareholderMetricValue = (
@@ -413,13 +414,13 @@ def _split_dividend_basis(text: str) -> str | None:
 
 
 def _split_context_excerpt(text: str) -> str:
-    compact = re.sub(r"\s+", " ", text).strip()
+    compact = " ".join(text.split())
     return compact[:220]
 
 
 def _split_event_sentences(text: str) -> list[str]:
     normalized = _normalize_note_text(text)
-    chunks = re.split(r"(?<=。)|(?<=\.)|\n", normalized)
+    chunks = _SENTENCE_BREAK_RE.split(normalized)
     return [
         chunk.strip()
         for chunk in chunks
@@ -34,6 +34,9 @@ from blue_ticker.constants.xbrl import (
 from blue_ticker.utils.xbrl_result_types import TaxExpenseResult
 
 
+_PERIOD_HEADING_RE = re.compile(r"第\d+期")
+
+
 def _extract_usgaap_tax_from_html(xbrl_dir: Path) -> TaxExpenseResult | None:
     """US-GAAP企業の連結損益計算書(0105010)HTMLから税引前利益・法人税等を抽出する。"""
     if not _BS4_AVAILABLE:
@@ -85,7 +88,7 @@ def _extract_usgaap_tax_from_html(xbrl_dir: Path) -> TaxExpenseResult | None:
                     current_col_idx = last_col
                 elif "前連結" in text or "前期" in text:
                     prior_col_idx = last_col
-                elif re.search(r"第\d+期", text):
+                elif _PERIOD_HEADING_RE.search(text):
                     if prior_col_idx is None:
                         prior_col_idx = col_offset
                     else:
@@ -5,9 +5,14 @@ XBRL解析モジュール
 XBRLインスタンス文書（XML形式）からテキストブロックを抽出します。
 """
 
+import importlib.util
 import logging
+import os
 import re
 import html
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from ..constants.xbrl import XBRL_SECTIONS
@@ -19,6 +24,13 @@ except ImportError:
     BS4_AVAILABLE = False
     logging.warning("beautifulsoup4がインストールされていません。XBRL解析機能は使用できません。")
 
+# lxml は任意依存。利用可能ならモジュール読み込み時に1回だけ判定して高速な C パーサーを使う
+_HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+
+# 見出しタグ（find_all 用の並びと、兄弟要素の判定用の集合）
+_HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+_HEADINGS = frozenset(_HEADING_TAGS)
+
 try:
     import xml.etree.ElementTree as ET
     ET_AVAILABLE = True
@@ -28,6 +40,132 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+# 改行を含む空白の連続（前後の行の空白・空行ごと1つの改行にまとめる）
+_LINE_BREAK_RUN_RE = re.compile(r'\s*\n\s*')
+
+# 項目名フォールバック用: 全セクションの項目名を1本の正規表現にまとめ、各ブロック冒頭を1回だけ走査する
+# （【項目名】等の表記ゆれはいずれも項目名そのものを含むため、項目名の一致判定に集約できる）
+_SECTION_ID_BY_TITLE: dict[str, str] = {
+    section_def['title']: section_id for section_id, section_def in XBRL_SECTIONS.items()
+}
+_SECTION_TITLE_RE = re.compile(
+    '|'.join(re.escape(title) for title in sorted(_SECTION_ID_BY_TITLE, key=len, reverse=True))
+)
+# セクションID → 検索対象のXBRL要素名（抽出のたびに定義を引き直さないよう固定）
+_SECTION_XBRL_ELEMENTS: dict[str, tuple[str, ...]] = {
+    section_id: tuple(section_def.get('xbrl_elements', ())) for section_id, section_def in XBRL_SECTIONS.items()
+}
+# 全セクションの検索対象要素名（重複除去・定義順）
+_ALL_SECTION_XBRL_ELEMENTS: tuple[str, ...] = tuple(
+    dict.fromkeys(element for elements in _SECTION_XBRL_ELEMENTS.values() for element in elements)
+)
+# 項目名を探すブロック冒頭の文字数
+_TITLE_SEARCH_PREFIX_LEN = 500
+
+# インスタンス文書ではないリンクベース（ラベル・表示・計算・定義）
+_LINKBASE_XML_SUFFIXES = ('_lab.xml', '_pre.xml', '_cal.xml', '_def.xml')
+
+
+@dataclass(frozen=True)
+class _XbrlDirFiles:
+    """XBRL展開ディレクトリ内のファイル一覧（1回の走査で分類したもの）"""
+    instance_files: tuple[Path, ...]  # .xml（リンクベース除く）→ .xbrl の順
+    html_files: tuple[Path, ...]  # .html → .htm の順
+    section_html_files: tuple[Path, ...]  # 本文ファイル（honbun, ixbrl）があればそれのみ、なければ html_files
+
+
+def _iter_completed_elements(xml_file: Path) -> Iterator[ET.Element]:
+    """XMLファイルを逐次解析し、終了タグまで読み終えた要素を順に返す
+
+    ルート直下の要素を読み終えるたびに解析済みの木を破棄するので、
+    メモリ使用量は文書全体ではなくルート直下の1要素分で頭打ちになる。
+    """
+    events = ET.iterparse(xml_file, events=('start', 'end'))
+    root = None
+    depth = 0
+    for event, elem in events:
+        if event == 'start':
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+        depth -= 1
+        yield elem
+        if depth == 1 and root is not None:
+            # ルート直下の要素を読み終えたら、それまでの子要素を解放する
+            root.clear()
+
+
+def _file_signatures(files: tuple[Path, ...]) -> tuple[tuple[str, int, int], ...]:
+    """メモ化キー用の (パス, mtime_ns, サイズ) の並び
+
+    展開ディレクトリ直下の mtime は入れ子の XBRL/PublicDoc 内の書き換えでは変わらないため、
+    対象ファイル自体の状態をキーにする（追加・削除・書き換えのいずれでも別キーになる）。
+    """
+    signatures: list[tuple[str, int, int]] = []
+    for path in files:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        signatures.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signatures)
+
+
+def _iter_file_entries(dir_path: str) -> Iterator[os.DirEntry[str]]:
+    """os.scandir で再帰的にファイルを列挙する（os.walk と同じ順序・シンボリックリンク先のディレクトリは辿らない）
+
+    DirEntry がディレクトリ読み出し時に得た種別情報を使うので、エントリごとの stat を省ける。
+    """
+    subdirs: list[str] = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            else:
+                yield entry
+    for subdir in subdirs:
+        yield from _iter_file_entries(subdir)
+
+
+def _scan_xbrl_dir(xbrl_dir_str: str) -> _XbrlDirFiles:
+    """ディレクトリを1回だけ走査し、拡張子ごとにファイルを分類する"""
+    xml_files: list[Path] = []
+    xbrl_files: list[Path] = []
+    html_files: list[Path] = []
+    htm_files: list[Path] = []
+    for entry in _iter_file_entries(xbrl_dir_str):
+        name = entry.name
+        if name.endswith('.xml'):
+            if not any(suffix in name for suffix in _LINKBASE_XML_SUFFIXES):
+                xml_files.append(Path(entry.path))
+        elif name.endswith('.xbrl'):
+            xbrl_files.append(Path(entry.path))
+        elif name.endswith('.html'):
+            html_files.append(Path(entry.path))
+        elif name.endswith('.htm'):
+            htm_files.append(Path(entry.path))
+
+    all_html_files = tuple(html_files + htm_files)
+    # 不要なHTML（監査報告書など）を除外するため、本文が含まれるファイルを優先
+    body_html_files = tuple(f for f in all_html_files if "honbun" in f.name or "ixbrl" in f.name)
+    return _XbrlDirFiles(
+        instance_files=tuple(xml_files + xbrl_files),
+        html_files=all_html_files,
+        section_html_files=body_html_files or all_html_files,
+    )
+
+
+@lru_cache(maxsize=64)
+def _section_title_pattern(section_title: str) -> re.Pattern[str]:
+    """項目名のフレーズを探す正規表現（項目名ごとに1回だけコンパイル）
+
+    「【」で始まる場合は最初の「】」まで、そうでない場合は直後の「】」のみを閉じ括弧とみなす。
+    """
+    return re.compile(rf'(?P<open>【)?{re.escape(section_title)}(?(open)[^】]*)(?P<close>】)?')
+
 
 class XBRLParser:
     """XBRL解析クラス"""
@@ -36,7 +174,16 @@ class XBRLParser:
         """初期化"""
         if not BS4_AVAILABLE:
             logger.warning("beautifulsoup4がインストールされていません。")
-    
+
+    def _scan(self, xbrl_dir: Path) -> _XbrlDirFiles:
+        """ディレクトリ内のファイルを拡張子ごとに分類して返す"""
+        return _scan_xbrl_dir(str(xbrl_dir))
+
+    def clear_cache(self) -> None:
+        """インスタンス文書単位のメモ化結果（報告書タイプ・テキストブロック）を破棄する"""
+        XBRLParser._detect_report_type_cached.cache_clear()
+        XBRLParser._load_text_blocks.cache_clear()
+
     def _find_section(self, soup: BeautifulSoup, section_title: str) -> str | None:
         """
         セクションを検索してテキストを抽出
@@ -55,23 +202,21 @@ class XBRLParser:
         # 有価証券報告書の構造に応じて検索パターンを調整
         
         # パターン1: 見出しタグ（h1-h6）で検索
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        headings = soup.find_all(_HEADING_TAGS)
         for heading in headings:
             if section_title in heading.get_text():
                 # 次の見出しまでを取得
                 content = []
-                current = heading.next_sibling
-                while current:
-                    current_name = getattr(current, 'name', None)
-                    if current_name:
-                        if current_name in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6'):
+                for sibling in heading.next_siblings:
+                    sibling_name = getattr(sibling, 'name', None)
+                    if sibling_name:
+                        if sibling_name in _HEADINGS:
                             break
-                        text = current.get_text(strip=True)
+                        text = sibling.get_text(strip=True)
                     else:
-                        text = str(current).strip()
+                        text = str(sibling).strip()
                     if text:
                         content.append(text)
-                    current = current.next_sibling
                 
                 if content:
                     return "\n".join(content)
@@ -112,14 +257,8 @@ class XBRLParser:
         # インラインXBRLファイルを検索（通常はPublicDocディレクトリ内）
         # 文書によっては XBRL/PublicDoc のように入れ子になっている場合があるため、
         # ディレクトリ全体から PublicDoc を再帰的に探すか、HTMLファイルを直接探す
-        html_files = list(xbrl_dir.rglob("*.html")) + list(xbrl_dir.rglob("*.htm"))
-        
-        # 不要なHTML（監査報告書など）を除外するためのフィルタリング
-        # 本文が含まれるファイル（honbun, ixbrlなど）を優先
-        if html_files:
-            priority_files = [f for f in html_files if "honbun" in f.name or "ixbrl" in f.name]
-            if priority_files:
-                html_files = priority_files
+        # 不要なHTML（監査報告書など）を除いた本文ファイル（走査時に1回だけ分類済み）
+        html_files = self._scan(xbrl_dir).section_html_files
         
         if not html_files:
             logger.warning(f"HTMLファイルが見つかりませんでした: {xbrl_dir}")
@@ -128,30 +267,18 @@ class XBRLParser:
         # 各HTMLファイルを順番に解析
         for html_file in html_files:
             try:
-                with open(html_file, "r", encoding="utf-8") as f:
-                    content = f.read()
+                # bytes のまま渡し、str へのデコードと再エンコードの往復を避ける
+                content = html_file.read_bytes()
                 
-                # lxmlが利用可能な場合は高速なlxmlを使用、そうでない場合はhtml.parserを使用
-                try:
-                    soup = BeautifulSoup(content, "lxml")
-                except Exception:
-                    logger.debug("lxmlが利用できないため、html.parserを使用します")
-                    soup = BeautifulSoup(content, "html.parser")
+                soup = BeautifulSoup(content, _HTML_PARSER, from_encoding="utf-8")
                 
                 # セクションを検索
                 section_text = self._find_section(soup, section_name)
                 
                 if section_text:
                     # テキスト整形
-                    # HTMLタグ除去、余分な空白・改行削除
-                    lines = section_text.split("\n")
-                    cleaned_lines = []
-                    for line in lines:
-                        line = line.strip()
-                        if line:
-                            cleaned_lines.append(line)
-                    
-                    result = "\n".join(cleaned_lines)
+                    # 各行の前後の空白と空行を除去（行リストを作らず1回の置換で行う）
+                    result = _LINE_BREAK_RUN_RE.sub("\n", section_text).strip()
                     
                     # 長すぎる場合は切り詰め（10,000文字まで）
                     if len(result) > 10000:
@@ -177,15 +304,18 @@ class XBRLParser:
         Returns:
             'annual' (有価証券報告書) または 'interim' (半期報告書)
         """
-        # XBRLインスタンス文書を検索
-        xml_files = []
-        for xml_file in xbrl_dir.rglob("*.xml"):
-            if any(suffix in xml_file.name for suffix in ['_lab.xml', '_pre.xml', '_cal.xml', '_def.xml']):
-                continue
-            xml_files.append(xml_file)
-        
-        xbrl_files = list(xbrl_dir.rglob("*.xbrl"))
-        xml_files.extend(xbrl_files)
+        instance_signature = _file_signatures(self._scan(xbrl_dir).instance_files)
+        return XBRLParser._detect_report_type_cached(str(xbrl_dir), instance_signature)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _detect_report_type_cached(
+        xbrl_dir_str: str, instance_signature: tuple[tuple[str, int, int], ...]
+    ) -> str:
+        """_detect_report_type の本体（インスタンス文書の状態単位でメモ化）"""
+        xbrl_dir = Path(xbrl_dir_str)
+        # XBRLインスタンス文書
+        xml_files = [Path(path) for path, _mtime_ns, _size in instance_signature]
         
         # ファイル名から判定
         for xml_file in xml_files:
@@ -247,9 +377,13 @@ class XBRLParser:
             logger.warning(f"XBRLディレクトリが存在しません: {xbrl_dir}")
             return {}
         
+        # XBRLインスタンス文書を検索
+        xml_files = self._scan(xbrl_dir).instance_files
+        instance_signature = _file_signatures(xml_files)
+        
         # 報告書タイプを判定（指定されていない場合）
         if report_type is None:
-            report_type = self._detect_report_type(xbrl_dir)
+            report_type = XBRLParser._detect_report_type_cached(str(xbrl_dir), instance_signature)
         
         is_interim = (report_type == 'interim')
         if is_interim:
@@ -258,103 +392,141 @@ class XBRLParser:
         sections = XBRL_SECTIONS
         logger.info(f"抽出対象セクション数: {len(sections)}")
         
-        # XBRLインスタンス文書を検索
-        xml_files = []
-        for xml_file in xbrl_dir.rglob("*.xml"):
-            if any(suffix in xml_file.name for suffix in ['_lab.xml', '_pre.xml', '_cal.xml', '_def.xml']):
-                continue
-            xml_files.append(xml_file)
-        
-        xbrl_files = list(xbrl_dir.rglob("*.xbrl"))
-        xml_files.extend(xbrl_files)
-        
         if not xml_files:
             logger.warning(f"XBRLインスタンス文書が見つかりません: {xbrl_dir}")
             return {}
         
         # 全てのテキストブロック要素を抽出（要素名ベース）
-        all_text_blocks = {}
-        namespaces = {}
+        all_text_blocks = XBRLParser._load_text_blocks(instance_signature)
+        
+        # 要素名 → テキストブロック名の索引
+        # 完全一致はハッシュ参照で引き、部分一致（提出者独自の接頭・接尾辞付き要素名）は要素ごとに1回だけ走査する
+        block_by_element: dict[str, str] = {
+            element: element for element in _ALL_SECTION_XBRL_ELEMENTS if element in all_text_blocks
+        }
+        pending = [element for element in _ALL_SECTION_XBRL_ELEMENTS if element not in block_by_element]
+        if pending:
+            # 部分一致はブロック名を1回だけ走査し、各要素について最初に含むブロックを採用する
+            for name in all_text_blocks:
+                for element in pending:
+                    if element in name:
+                        block_by_element.setdefault(element, name)
+                if len(block_by_element) == len(_ALL_SECTION_XBRL_ELEMENTS):
+                    break
         
-        for xml_file in xml_files:
-            try:
-                tree = ET.parse(xml_file)
-                root = tree.getroot()
-                
-                # 名前空間を登録
-                for prefix, uri in root.attrib.items():
-                    if prefix.startswith('xmlns'):
-                        if prefix == 'xmlns':
-                            namespaces[''] = uri
-                        else:
-                            ns_prefix = prefix.replace('xmlns:', '')
-                            namespaces[ns_prefix] = uri
-                
-                # 全ての要素を走査してテキストブロックを検索
-                for elem in root.iter():
-                    tag = elem.tag
-                    # 名前空間を除去
-                    if '}' in tag:
-                        local_tag = tag.split('}')[1]
-                    else:
-                        local_tag = tag
-                    
-                    # TextBlockで終わる要素を検索
-                    if local_tag.endswith('TextBlock') or 'TextBlock' in local_tag:
-                        # 要素のテキストを取得
-                        text = self._extract_text_from_html_element_simple(elem)
-                        if text and len(text) > 50:
-                            # 要素名をキーとして保存
-                            all_text_blocks[local_tag] = text
-                            
-            except ET.ParseError as e:
-                logger.warning(f"XMLパースエラー: {xml_file.name} - {e}")
-                continue
-            except Exception as e:
-                logger.error(f"XBRLテキスト抽出エラー: {xml_file.name} - {e}", exc_info=True)
-                continue
+        # 要素名で検索
+        block_by_section: dict[str, str] = {}
+        for section_id, section_def in sections.items():
+            block_name = next(
+                (block_by_element[element] for element in _SECTION_XBRL_ELEMENTS[section_id] if element in block_by_element),
+                None,
+            )
+            if block_name is not None:
+                block_by_section[section_id] = block_name
+                logger.debug("セクション %s (%s) を要素名で発見: %s", section_id, section_def['title'], block_name)
+        
+        # 要素名で見つからないセクションは、ブロック冒頭に項目名を含む最初のブロックを採用する
+        unresolved = {section_id for section_id in sections if section_id not in block_by_section}
+        if unresolved:
+            for block_name, block_text in all_text_blocks.items():
+                for match in _SECTION_TITLE_RE.finditer(block_text, 0, _TITLE_SEARCH_PREFIX_LEN):
+                    section_id = _SECTION_ID_BY_TITLE[match.group()]
+                    if section_id in unresolved:
+                        unresolved.discard(section_id)
+                        block_by_section[section_id] = block_name
+                        logger.debug("セクション %s (%s) を項目名で発見: %s", section_id, sections[section_id]['title'], block_name)
+                if not unresolved:
+                    break
         
         # セクション定義に基づいて抽出
         result = {}
         for section_id, section_def in sections.items():
-            section_text = None
-            section_title = section_def.get('title', '')
-            xbrl_elements = section_def.get('xbrl_elements', [])
-
-            # 完全な項目名のフレーズで検索（様々なパターン）
-            title_patterns = [
-                section_title,
-                f'【{section_title}】',
-                f'{section_title}】',
-                f'【{section_title}',
-            ]
-
-            for block_name, block_text in all_text_blocks.items():
-                element_found = any(
-                    element in block_name or block_name.endswith(element)
-                    for element in xbrl_elements
-                )
-                if element_found or any(pattern in block_text[:500] for pattern in title_patterns):
-                    section_text = block_text
-                    logger.debug(f"セクション {section_id} ({section_def['title']}) を発見: {block_name}")
-                    break
+            block_name = block_by_section.get(section_id)
+            section_text = all_text_blocks[block_name] if block_name is not None else None
             
             if section_text:
                 # 項目名のフレーズで始まるように調整
                 section_text = self._ensure_starts_with_section_title(section_text, section_def['title'])
                 result[section_id] = section_text
-                logger.info(f"セクション {section_id} ({section_def['title']}) 抽出成功: {len(section_text)}文字")
+                logger.info("セクション %s (%s) 抽出成功: %d文字", section_id, section_def['title'], len(section_text))
             else:
                 # セクションが見つからない場合
                 # 半期報告書の場合は正常な動作として扱う（一部セクションがないことがある）
                 if is_interim:
-                    logger.debug(f"セクション {section_id} ({section_def['title']}) が見つかりませんでした（半期報告書のため正常です）")
+                    logger.debug("セクション %s (%s) が見つかりませんでした（半期報告書のため正常です）", section_id, section_def['title'])
                 else:
-                    logger.debug(f"セクション {section_id} ({section_def['title']}) が見つかりませんでした（空文字列を返します）")
+                    logger.debug("セクション %s (%s) が見つかりませんでした（空文字列を返します）", section_id, section_def['title'])
                 result[section_id] = ""
         
         return result
     
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _load_text_blocks(instance_signature: tuple[tuple[str, int, int], ...]) -> dict[str, str]:
+        """
+        インスタンス文書から全てのテキストブロック要素を抽出（インスタンス文書の状態単位でメモ化）
+
+        戻り値はキャッシュ共有されるため、呼び出し側で変更しないこと。
+
+        Returns:
+            {要素のローカル名: テキスト} の辞書
+        """
+        xml_files = [Path(path) for path, _mtime_ns, _size in instance_signature]
+        
+        per_file_blocks = [XBRLParser._load_text_blocks_from_file(xml_file) for xml_file in xml_files]
+        
+        # ファイル順にマージ（同名要素は後のファイルが優先）
+        all_text_blocks: dict[str, str] = {}
+        failed: list[str] = []
+        for blocks, error in per_file_blocks:
+            all_text_blocks.update(blocks)
+            if error is not None:
+                failed.append(error)
+        
+        # 失敗はファイルごとではなくまとめて1回だけ記録する
+        if failed:
+            logger.warning("XBRLテキスト抽出に失敗したファイル: %d件 %s", len(failed), failed[:5])
+        
+        return all_text_blocks
+    
+    @staticmethod
+    def _load_text_blocks_from_file(xml_file: Path) -> tuple[list[tuple[str, str]], str | None]:
+        """
+        1つのインスタンス文書からテキストブロック要素を抽出
+        
+        Returns:
+            ((要素のローカル名, テキスト) のリスト, エラー内容)。
+            解析に失敗した場合は (空リスト, エラー内容)、成功時のエラー内容は None
+        """
+        text_blocks: list[tuple[str, str]] = []
+        try:
+            # 全ての要素を逐次走査してテキストブロックを検索
+            for elem in _iter_completed_elements(xml_file):
+                tag = elem.tag
+                # 名前空間を除去
+                if '}' in tag:
+                    local_tag = tag.split('}')[1]
+                else:
+                    local_tag = tag
+                
+                # TextBlockで終わる要素を検索
+                if local_tag.endswith('TextBlock') or 'TextBlock' in local_tag:
+                    # 要素のテキストを取得
+                    text = XBRLParser._extract_text_from_html_element_simple(elem)
+                    if text and len(text) > 50:
+                        # 要素名をキーとして保存
+                        text_blocks.append((local_tag, text))
+                        
+        except ET.ParseError as e:
+            # 逐次解析の途中で失敗した場合も、そのファイルの抽出結果は使わない
+            return [], f"XMLパースエラー: {xml_file.name} - {e}"
+        except Exception as e:
+            # トレースバックは DEBUG 有効時のみ整形される
+            logger.debug("XBRLテキスト抽出エラー: %s", xml_file.name, exc_info=True)
+            return [], f"XBRLテキスト抽出エラー: {xml_file.name} - {e}"
+        
+        return text_blocks, None
+    
     def _ensure_starts_with_section_title(self, text: str, section_title: str) -> str:
         """
         抽出したテキストが項目名のフレーズで始まるように調整
@@ -366,105 +538,43 @@ class XBRLParser:
         Returns:
             項目名のフレーズで始まるように調整されたテキスト
         """
+        stripped = text.strip()
         # 既に項目名で始まっている場合はそのまま返す
-        if text.strip().startswith(section_title):
-            return text.strip()
-        
-        # 項目名のフレーズを探す（様々なパターン）
-        patterns = [
-            f'【{section_title}】',  # 【項目名】
-            f'{section_title}】',  # 項目名】
-            f'【{section_title}',  # 【項目名
-            section_title,  # 完全一致
-        ]
-        
-        # テキスト内で項目名のフレーズを探す
-        best_match = None
-        best_idx = len(text)
-        
-        for pattern in patterns:
-            idx = text.find(pattern)
-            if idx != -1 and idx < best_idx:
-                best_match = pattern
-                best_idx = idx
-        
-        if best_match is not None:
-            # 項目名のフレーズが見つかった位置から開始
-            adjusted_text = text[best_idx:]
-            
-            # 項目名のフレーズの前にある数字や記号を除去
-            # 例：「２【事業の内容】」→「事業の内容」で始まるように
-            # 例：「事業の内容】」→「事業の内容」で始まるように
-            if adjusted_text.startswith('【'):
-                # 【項目名】の場合
-                if adjusted_text.startswith(f'【{section_title}】'):
-                    adjusted_text = adjusted_text[len(f'【{section_title}】'):].lstrip()
-                    adjusted_text = section_title + (' ' if adjusted_text else '') + adjusted_text
-                elif adjusted_text.startswith(f'【{section_title}'):
-                    # 【項目名 の場合
-                    end_idx = adjusted_text.find('】')
-                    if end_idx != -1:
-                        adjusted_text = adjusted_text[end_idx + 1:].lstrip()
-                        adjusted_text = section_title + (' ' if adjusted_text else '') + adjusted_text
-            elif adjusted_text.startswith(f'{section_title}】'):
-                # 項目名】の場合
-                adjusted_text = adjusted_text[len(f'{section_title}】'):].lstrip()
-                adjusted_text = section_title + (' ' if adjusted_text else '') + adjusted_text
-            elif not adjusted_text.startswith(section_title):
-                # 項目名で始まっていない場合、項目名を探してその位置から開始
-                title_idx = adjusted_text.find(section_title)
-                if title_idx != -1:
-                    # 項目名の前の部分を除去
-                    adjusted_text = adjusted_text[title_idx:]
-                    # 項目名の後に】がある場合は除去
-                    if adjusted_text.startswith(section_title + '】'):
-                        adjusted_text = adjusted_text[len(section_title + '】'):].lstrip()
-                        adjusted_text = section_title + (' ' if adjusted_text else '') + adjusted_text
-                    elif adjusted_text.startswith(section_title):
-                        # 項目名の直後にスペースがない場合は追加
-                        if len(adjusted_text) > len(section_title) and adjusted_text[len(section_title)] not in [' ', '　', '】']:
-                            adjusted_text = section_title + ' ' + adjusted_text[len(section_title):].lstrip()
-            
-            return adjusted_text.strip()
-        
-        # 項目名のフレーズが見つからない場合は、項目名を先頭に追加
-        return section_title + ' ' + text.strip()
+        if stripped.startswith(section_title):
+            return stripped
+        
+        # 最初に現れる項目名のフレーズ（【項目名】/【項目名…】/項目名】/項目名）を探す
+        match = _section_title_pattern(section_title).search(text)
+        if match is None:
+            # 項目名のフレーズが見つからない場合は、項目名を先頭に追加
+            return section_title + ' ' + stripped
+        
+        if match.group('close'):
+            # 例：「２【事業の内容】」「事業の内容】」→「事業の内容」で始まるように括弧を外す
+            body = text[match.end():].strip()
+            return section_title + (' ' if body else '') + body
+        
+        # 閉じ括弧がない場合は、項目名のフレーズが見つかった位置から開始
+        return text[match.start():].strip()
     
     
-    def _extract_text_from_html_element_simple(self, element: ET.Element) -> str:
+    @staticmethod
+    def _extract_text_from_html_element_simple(element: ET.Element) -> str:
         """HTMLタグを含む要素からテキストを抽出（テーブル判定なし）"""
-        # 要素のテキストを取得
-        text_parts = []
-        
-        # 要素の直接のテキスト
-        if element.text:
-            text = element.text.strip()
-            if text:
-                text_parts.append(text)
-        
-        # 子要素からテキストを再帰的に抽出
-        for child in element:
-            child_text = self._extract_text_from_html_element_simple(child)
-            if child_text:
-                text_parts.append(child_text)
-            
-            # 子要素の後のテキスト（tail）
-            if child.tail:
-                tail_text = child.tail.strip()
-                if tail_text:
-                    text_parts.append(tail_text)
-        
-        combined_text = '\n'.join(text_parts)
+        # 子孫要素のテキスト・tail をまとめて取得（再帰的な Python 走査は不要）
+        # テキストブロックの本文はエスケープされた HTML 文字列なので、タグ除去は後段で行う
+        combined_text = ' '.join(element.itertext())
         
-        # HTMLエンティティをデコード
-        combined_text = html.unescape(combined_text)
+        # HTMLエンティティをデコード（XMLパーサーが解決するのは XML の実体参照まで。
+        # 本文中の &nbsp; 等は残るため、"&" を含む場合だけ走査する）
+        if '&' in combined_text:
+            combined_text = html.unescape(combined_text)
         
         # HTMLタグを除去（正規表現で）
-        combined_text = re.sub(r'<[^>]+>', '', combined_text)
+        combined_text = _HTML_TAG_RE.sub('', combined_text)
         
-        # 余分な空白を整理
-        combined_text = re.sub(r'\s+', ' ', combined_text)
-        combined_text = combined_text.strip()
+        # 余分な空白を整理（split/join は C 実装で、\s+ 置換 + strip と同じ結果になる）
+        combined_text = ' '.join(combined_text.split())
         
         return combined_text
     
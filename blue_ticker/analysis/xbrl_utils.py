@@ -24,6 +24,9 @@ except ImportError:
 from blue_ticker.utils.xbrl_result_types import XbrlFact, XbrlFactIndex, XbrlTagElements
 
 
+_UNIT_SUFFIX_RE = re.compile(r'(百万円|十万円|億円|兆円|千円|百円|万円|円)$')
+
+
 def parse_html_int_attribute(element: Any, attr: str, default: int = 1) -> int:
     """HTML要素の整数属性を安全に読む。BeautifulSoup の型定義は list/None も返し得る。"""
     value = element.get(attr)
@@ -44,7 +47,7 @@ def parse_html_number(text: str) -> float | None:
     if not text:
         return None
     text = text.strip()
-    text = re.sub(r'(百万円|十万円|億円|兆円|千円|百円|万円|円)$', '', text).strip()
+    text = _UNIT_SUFFIX_RE.sub('', text).strip()
     text = text.replace(",", "").replace("，", "")
     # △ は日本の会計慣行で負数を示す（例: △8,752 → -8752）
     if text.startswith("△"):
@@ -6,7 +6,8 @@ operation can provide another implementation with the same contract.
 """
 
 from abc import ABC, abstractmethod
-from contextlib import AbstractContextManager
+from collections.abc import AsyncIterator
+from contextlib import AbstractContextManager, asynccontextmanager
 from pathlib import Path
 from typing import Any
 
@@ -38,10 +39,24 @@ class EdinetCacheBackend(ABC):
     def save_search_cache(self, filename: str, data: list[dict[str, Any]]) -> None:
         """日別検索結果を保存する。"""
 
+    def load_search_cache_validators(self, filename: str) -> dict[str, str]:
+        """日別検索結果の HTTP 検証子（etag / last_modified）を返す。未対応の backend は空 dict。"""
+        return {}
+
+    def save_search_cache_validators(self, filename: str, validators: dict[str, str]) -> None:
+        """日別検索結果の HTTP 検証子を保存する。未対応の backend は何もしない。"""
+        return None
+
     @abstractmethod
     def file_lock(self, name: str) -> AbstractContextManager[None]:
         """同一キャッシュ生成処理の重複を避けるロックを返す。"""
 
+    @asynccontextmanager
+    async def async_file_lock(self, name: str) -> AsyncIterator[None]:
+        """file_lock の非同期版。既定では file_lock をそのまま使う。"""
+        with self.file_lock(name):
+            yield
+
     @abstractmethod
     def load_document_index(
         self,
@@ -4,6 +4,8 @@ EDINET ローカルキャッシュ境界。
 日別書類一覧と XBRL パッケージの保存形式を API 通信から分離する。
 """
 
+import asyncio
+import io
 import json
 import logging
 import os
@@ -11,8 +13,8 @@ import shutil
 import sys
 import time
 import zipfile
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -26,7 +28,9 @@ from blue_ticker.constants.api import (
     EDINET_SEARCH_EMPTY_TTL_DAYS,
     EDINET_SEARCH_HIT_TTL_DAYS,
     EDINET_SEARCH_PAST_TTL_DAYS,
+    EDINET_SEARCH_VALIDATORS_DIRNAME,
     EDINET_XBRL_MAX_BYTES,
+    EDINET_XBRL_SKIPPED_SUFFIXES,
 )
 from blue_ticker.api.edinet_cache_backend import EdinetCacheBackend
 from blue_ticker.utils.fiscal_year import parse_date_string
@@ -34,6 +38,7 @@ from blue_ticker.utils.fiscal_year import parse_date_string
 logger = logging.getLogger(__name__)
 
 _COMPACT_JSON_SEPARATORS = (",", ":")
+_ZIP_COPY_BUFFER_BYTES = 1024 * 1024
 
 
 class EdinetCacheStore(EdinetCacheBackend):
@@ -50,6 +55,8 @@ class EdinetCacheStore(EdinetCacheBackend):
     ):
         self.cache_dir = Path(cache_dir)
         self.documents_by_date_dir = self.cache_dir / "documents_by_date"
+        # 日別検索結果の HTTP 検証子。search_*.json と同じ名前で別ディレクトリに置く
+        self.search_validators_dir = self.cache_dir / EDINET_SEARCH_VALIDATORS_DIRNAME
         self.document_indexes_dir = self.cache_dir / "document_indexes"
         self.xbrl_root_dir = self.cache_dir / "xbrl"
         self.locks_dir = self.cache_dir / "locks"
@@ -57,6 +64,8 @@ class EdinetCacheStore(EdinetCacheBackend):
         self.search_hit_ttl_days = search_hit_ttl_days
         self.search_past_ttl_days = search_past_ttl_days
         self.max_xbrl_bytes = max_xbrl_bytes
+        # 年次インデックスの解析結果（パス → ((mtime_ns, size), payload)）
+        self._document_index_payloads: dict[Path, tuple[tuple[int, int], Any]] = {}
 
     def search_cache_key(self, date_str: str) -> str:
         """日別検索キャッシュのファイル名を返す。"""
@@ -80,7 +89,7 @@ class EdinetCacheStore(EdinetCacheBackend):
         if not cache_path.exists():
             return None
         try:
-            data = json.loads(cache_path.read_text(encoding="utf-8"))
+            data = json.loads(cache_path.read_bytes())
         except Exception as e:
             logger.warning(f"Cache load failed: {e}")
             return None
@@ -103,43 +112,105 @@ class EdinetCacheStore(EdinetCacheBackend):
         except Exception as e:
             logger.warning(f"Cache save failed: {e}")
 
+    def load_search_cache_validators(self, filename: str) -> dict[str, str]:
+        """日別検索結果と一緒に保存した HTTP 検証子を読み込む。"""
+        try:
+            data = json.loads(self._search_validators_path(filename).read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Cache validators load failed: {e}")
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {k: v for k, v in data.items() if isinstance(k, str) and isinstance(v, str)}
+
+    def save_search_cache_validators(self, filename: str, validators: dict[str, str]) -> None:
+        """日別検索結果の HTTP 検証子を保存する。空なら古い検証子を消す。"""
+        validators_path = self._search_validators_path(filename)
+        try:
+            if not validators:
+                validators_path.unlink(missing_ok=True)
+                return
+            validators_path.parent.mkdir(parents=True, exist_ok=True)
+            validators_path.write_text(
+                json.dumps(validators, ensure_ascii=False, separators=_COMPACT_JSON_SEPARATORS),
+                encoding="utf-8",
+            )
+        except Exception as e:
+            logger.warning(f"Cache validators save failed: {e}")
+
+    def _search_validators_path(self, filename: str) -> Path:
+        return self.search_validators_dir / filename
+
     @contextmanager
     def file_lock(self, name: str) -> Iterator[None]:
         """複数CLIプロセス間で同じEDINETキャッシュ生成を重複させないためのロック。"""
-        lock_path = self.locks_dir / f"{_safe_lock_name(name)}.lock"
-        self.locks_dir.mkdir(parents=True, exist_ok=True)
+        lock_path = self._lock_path(name)
         start = time.monotonic()
-        fd: int | None = None
         notice_printed = False
-        while fd is None:
-            try:
-                fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-                payload = f"pid={os.getpid()} created_at={datetime.now().isoformat()}\n"
-                os.write(fd, payload.encode("utf-8"))
-            except FileExistsError:
-                if self._unlink_stale_lock(lock_path):
-                    continue
-                elapsed = time.monotonic() - start
-                if not notice_printed and elapsed >= EDINET_CACHE_LOCK_NOTICE_SECONDS:
-                    print(
-                        "EDINETキャッシュを準備中です。別のblue_tickerプロセスの完了を待っています...",
-                        file=sys.stderr,
-                    )
-                    notice_printed = True
-                if elapsed >= EDINET_CACHE_LOCK_TIMEOUT_SECONDS:
-                    raise TimeoutError(f"EDINET cache lock timeout: {name}")
-                time.sleep(EDINET_CACHE_LOCK_POLL_SECONDS)
+        while (fd := self._try_create_lock(lock_path)) is None:
+            notice_printed = self._check_lock_wait(name, start, notice_printed)
+            time.sleep(EDINET_CACHE_LOCK_POLL_SECONDS)
+        if notice_printed:
+            print("EDINETキャッシュの準備が完了しました。処理を続行します。", file=sys.stderr)
+        try:
+            yield
+        finally:
+            self._release_lock(fd, lock_path)
+
+    @asynccontextmanager
+    async def async_file_lock(self, name: str) -> AsyncIterator[None]:
+        """file_lock の非同期版。待機中もイベントループを止めないため、同一プロセス内の保持者が処理を進められる。"""
+        lock_path = self._lock_path(name)
+        start = time.monotonic()
+        notice_printed = False
+        while (fd := self._try_create_lock(lock_path)) is None:
+            notice_printed = self._check_lock_wait(name, start, notice_printed)
+            await asyncio.sleep(EDINET_CACHE_LOCK_POLL_SECONDS)
         if notice_printed:
             print("EDINETキャッシュの準備が完了しました。処理を続行します。", file=sys.stderr)
         try:
             yield
         finally:
-            if fd is not None:
-                os.close(fd)
+            self._release_lock(fd, lock_path)
+
+    def _lock_path(self, name: str) -> Path:
+        self.locks_dir.mkdir(parents=True, exist_ok=True)
+        return self.locks_dir / f"{_safe_lock_name(name)}.lock"
+
+    def _try_create_lock(self, lock_path: Path) -> int | None:
+        """ロックファイルを作成できれば fd を返す。他の保持者がいれば None。"""
+        while True:
             try:
-                lock_path.unlink()
-            except FileNotFoundError:
-                pass
+                fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if self._unlink_stale_lock(lock_path):
+                    continue
+                return None
+            payload = f"pid={os.getpid()} created_at={datetime.now().isoformat()}\n"
+            os.write(fd, payload.encode("utf-8"))
+            return fd
+
+    def _check_lock_wait(self, name: str, start: float, notice_printed: bool) -> bool:
+        """待機時間に応じて案内を表示し、上限を超えたら TimeoutError を送出する。表示済みかを返す。"""
+        elapsed = time.monotonic() - start
+        if not notice_printed and elapsed >= EDINET_CACHE_LOCK_NOTICE_SECONDS:
+            print(
+                "EDINETキャッシュを準備中です。別のblue_tickerプロセスの完了を待っています...",
+                file=sys.stderr,
+            )
+            notice_printed = True
+        if elapsed >= EDINET_CACHE_LOCK_TIMEOUT_SECONDS:
+            raise TimeoutError(f"EDINET cache lock timeout: {name}")
+        return notice_printed
+
+    def _release_lock(self, fd: int, lock_path: Path) -> None:
+        os.close(fd)
+        try:
+            lock_path.unlink()
+        except FileNotFoundError:
+            pass
 
     def _unlink_stale_lock(self, lock_path: Path) -> bool:
         try:
@@ -188,7 +259,7 @@ class EdinetCacheStore(EdinetCacheBackend):
         if not cache_path.exists():
             return None
         try:
-            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+            payload = self._read_document_index_payload(cache_path)
         except Exception as e:
             logger.warning(f"Document index load failed: {e}")
             return None
@@ -210,6 +281,21 @@ class EdinetCacheStore(EdinetCacheBackend):
             return None
         return {k: v for k, v in payload.items() if k != "_cache_version"}
 
+    def _read_document_index_payload(self, cache_path: Path) -> Any:
+        """年次インデックスの JSON を読む。ファイルの mtime・サイズが変わらない限り解析結果を再利用する。
+
+        探索の各段階・各年度で同じ年次インデックスを何度も参照するため、数MBの JSON を毎回解析しない。
+        戻り値は共有されるため、呼び出し側で変更しないこと。
+        """
+        stat = cache_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        memo = self._document_index_payloads.get(cache_path)
+        if memo is not None and memo[0] == signature:
+            return memo[1]
+        payload = json.loads(cache_path.read_bytes())
+        self._document_index_payloads[cache_path] = (signature, payload)
+        return payload
+
     def save_document_index(
         self,
         year: int,
@@ -225,6 +311,7 @@ class EdinetCacheStore(EdinetCacheBackend):
             "built_through": built_through,
             "documents": documents,
         }
+        self._document_index_payloads.pop(cache_path, None)
         try:
             cache_path.parent.mkdir(parents=True, exist_ok=True)
             cache_path.write_text(
@@ -241,6 +328,7 @@ class EdinetCacheStore(EdinetCacheBackend):
             self.cache_dir / self.document_index_cache_key(year),
         ]
         for path in paths:
+            self._document_index_payloads.pop(path, None)
             try:
                 path.unlink()
             except FileNotFoundError:
@@ -268,28 +356,33 @@ class EdinetCacheStore(EdinetCacheBackend):
         content: bytes,
         save_dir: str | Path | None = None,
     ) -> Path:
-        """XBRL zip を一時保存して安全に展開し、展開ディレクトリを返す。"""
+        """XBRL zip をメモリ上から安全に展開し、展開ディレクトリを返す（zip ファイルは書き出さない）。"""
         root = Path(save_dir) if save_dir is not None else self.xbrl_root_dir
         root.mkdir(parents=True, exist_ok=True)
         dest = self.xbrl_dir(doc_id, root)
-        zip_path = root / f"{doc_id}.zip"
 
-        zip_path.write_bytes(content)
         try:
-            with zipfile.ZipFile(zip_path, "r") as z:
+            with zipfile.ZipFile(io.BytesIO(content), "r") as z:
                 self._validate_members(z, dest)
                 dest.mkdir(parents=True, exist_ok=True)
-                z.extractall(dest)
+                self._extract_members(z, dest)
         except Exception:
             if dest.exists():
                 shutil.rmtree(dest)
             raise
-        finally:
-            if zip_path.exists():
-                zip_path.unlink()
         self._evict_xbrl_if_needed(root)
         return dest
 
+    def _extract_members(self, archive: zipfile.ZipFile, dest: Path) -> None:
+        """解析で使わない画像・PDF を除いて展開する（大きめのバッファでコピー）。"""
+        for info in archive.infolist():
+            if info.is_dir() or info.filename.lower().endswith(EDINET_XBRL_SKIPPED_SUFFIXES):
+                continue
+            target = dest / info.filename
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with archive.open(info) as src, target.open("wb") as dst:
+                shutil.copyfileobj(src, dst, _ZIP_COPY_BUFFER_BYTES)
+
     def _validate_members(self, archive: zipfile.ZipFile, dest: Path) -> None:
         dest_resolved = dest.resolve()
         for member in archive.namelist():
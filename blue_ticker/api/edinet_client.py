@@ -1,9 +1,13 @@
 import asyncio
 import logging
 import os
+import random
 import re
 import ssl
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,17 +15,26 @@ import aiohttp
 
 from ..constants.api import (
     EDINET_API_BASE_URL,
+    EDINET_CONCURRENCY_RECOVERY_SUCCESSES,
     EDINET_DOCUMENT_INDEX_BATCH_SIZE,
     EDINET_DOCUMENT_INDEX_MIN_RANGE_DAYS,
+    EDINET_HTTP_DNS_CACHE_SECONDS,
+    EDINET_HTTP_KEEPALIVE_SECONDS,
+    EDINET_MAX_CONCURRENT_REQUESTS,
+    EDINET_RETRY_BACKOFF_CAP_SECONDS,
     SSL_CA_BUNDLE_CANDIDATES,
     SSL_CERT_FILE_ENV,
 )
+from ..constants.formats import DATE_LEN_HYPHENATED
 from .edinet_cache_backend import EdinetCacheBackend
-from blue_ticker.utils.fiscal_year import normalize_date_format, parse_date_string
+from blue_ticker.utils.fiscal_year import normalize_date_format, parse_date_string, parse_hyphenated_date
 from .edinet_cache_store import EdinetCacheStore
 
 logger = logging.getLogger(__name__)
 
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_AFTER_MESSAGE_RE = re.compile(r"try again in\s+(\d+(?:\.\d+)?)\s+seconds", re.IGNORECASE)
+
 class EdinetAPIClient:
     """EDINET API v2 クライアント"""
 
@@ -39,8 +52,9 @@ class EdinetAPIClient:
         self._session: aiohttp.ClientSession | None = None
         self._session_loop: asyncio.AbstractEventLoop | None = None
         self._download_locks: dict[str, asyncio.Lock] = {}
-        self._date_fetch_semaphore = asyncio.Semaphore(10)
+        self._date_fetch_limiter = _AdaptiveConcurrencyLimiter(EDINET_MAX_CONCURRENT_REQUESTS)
         self._document_index_locks: dict[int, asyncio.Lock] = {}
+        self._document_index_views: dict[int, _DocumentIndexView] = {}
 
     def update_api_key(self, api_key: str | None) -> None:
         """APIキーを更新します。"""
@@ -65,7 +79,13 @@ class EdinetAPIClient:
             self._session = None
         if self._session is None or self._session.closed:
             ssl_context = _create_ssl_context()
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
+            # 同一ホストへの小さな GET が続くため、接続と名前解決を使い回す
+            connector = aiohttp.TCPConnector(
+                ssl=ssl_context,
+                limit_per_host=EDINET_MAX_CONCURRENT_REQUESTS,
+                keepalive_timeout=EDINET_HTTP_KEEPALIVE_SECONDS,
+                ttl_dns_cache=EDINET_HTTP_DNS_CACHE_SECONDS,
+            )
             self._session = aiohttp.ClientSession(connector=connector)
             self._session_loop = current_loop
         return self._session
@@ -77,13 +97,18 @@ class EdinetAPIClient:
         self._session = None
         self._session_loop = None
 
-    async def _request(
+    async def _request_json(
         self,
         endpoint: str,
         params: dict[str, Any] | None = None,
         max_retries: int = 3,
-    ) -> dict[str, Any]:
-        """リトライ機能付きAPIリクエスト実行（JSON応答）"""
+        *,
+        validators: dict[str, str] | None = None,
+    ) -> tuple[dict[str, Any] | None, dict[str, str]]:
+        """JSON応答と HTTP 検証子（ETag / Last-Modified）を返す。
+
+        validators を渡すと条件付き GET を行い、304 Not Modified の場合はデータに None を返す。
+        """
         if not self.api_key:
             raise ValueError("EDINET_API_KEY is not set")
 
@@ -95,16 +120,18 @@ class EdinetAPIClient:
         retry_wait_seconds: float | None = None
         session = await self._get_session()
         timeout = aiohttp.ClientTimeout(total=30)
+        headers = _conditional_headers(validators) if validators else None
 
         for attempt in range(max_retries):
             try:
                 if attempt > 0:
-                    wait_time = retry_wait_seconds if retry_wait_seconds is not None else 2 ** attempt
+                    await _wait_before_retry(attempt, max_retries, retry_wait_seconds)
                     retry_wait_seconds = None
-                    logger.warning(f"⚠️ [EDINET API] Retry attempt {attempt+1}/{max_retries} after {wait_time}s...")
-                    await asyncio.sleep(wait_time)
 
-                async with session.get(url, params=params, timeout=timeout) as response:
+                async with session.get(url, params=params, timeout=timeout, headers=headers) as response:
+                    if headers and response.status == 304:
+                        self._date_fetch_limiter.record_success()
+                        return None, dict(validators or {})
                     # JSONボディのビジネスエラーをステータスコードより先にチェック
                     try:
                         data = await response.json(content_type=None)
@@ -121,23 +148,26 @@ class EdinetAPIClient:
                                 message=f"EDINET API error: {status_code_in_body} - {message}",
                             )
                         response.raise_for_status()
-                        return data
+                        self._date_fetch_limiter.record_success()
+                        return data, _response_validators(response.headers)
                     except ValueError as e:
                         if "EDINET APIキーが無効です" in str(e):
                             raise
                         # JSON以外のレスポンス
                         response.raise_for_status()
-                        return {}
+                        return {}, {}
 
             except (aiohttp.ClientResponseError, aiohttp.ClientError, ValueError) as e:
                 last_exception = e
                 if isinstance(e, ValueError) and "EDINET APIキーが無効です" in str(e):
                     raise
 
-                status_code = getattr(e, "status", None)
-                if status_code in [429, 500, 502, 503, 504] or isinstance(e, aiohttp.ClientConnectorError):
+                if _is_retryable_error(e):
+                    status_code = getattr(e, "status", None)
                     if status_code == 429:
                         retry_wait_seconds = _retry_after_seconds(e)
+                    if status_code is not None:
+                        self._date_fetch_limiter.record_throttled()
                     continue
                 else:
                     logger.error(f"❌ [EDINET API] Non-retryable error: {e}")
@@ -170,10 +200,8 @@ class EdinetAPIClient:
         for attempt in range(max_retries):
             try:
                 if attempt > 0:
-                    wait_time = retry_wait_seconds if retry_wait_seconds is not None else 2 ** attempt
+                    await _wait_before_retry(attempt, max_retries, retry_wait_seconds)
                     retry_wait_seconds = None
-                    logger.warning(f"⚠️ [EDINET API] Retry attempt {attempt+1}/{max_retries} after {wait_time}s...")
-                    await asyncio.sleep(wait_time)
 
                 async with session.get(url, params=params, timeout=timeout) as response:
                     response.raise_for_status()
@@ -181,9 +209,8 @@ class EdinetAPIClient:
 
             except (aiohttp.ClientResponseError, aiohttp.ClientError) as e:
                 last_exception = e
-                status_code = getattr(e, "status", None)
-                if status_code in [429, 500, 502, 503, 504] or isinstance(e, aiohttp.ClientConnectorError):
-                    if status_code == 429:
+                if _is_retryable_error(e):
+                    if getattr(e, "status", None) == 429:
                         retry_wait_seconds = _retry_after_seconds(e)
                     continue
                 raise
@@ -217,19 +244,31 @@ class EdinetAPIClient:
             return documents
 
         try:
-            with self.cache_store.file_lock(f"documents_by_date_{date_str}"):
+            async with self.cache_store.async_file_lock(f"documents_by_date_{date_str}"):
                 documents = self._load_search_cache(cache_key)
                 if documents is not None:
                     return documents
 
-                async with self._date_fetch_semaphore:
+                async with self._date_fetch_limiter:
                     documents = self._load_search_cache(cache_key)
                     if documents is not None:
                         return documents
                     try:
-                        data = await self._request("/documents.json", {"date": date_str, "type": 2})
-                        documents = data.get("results", [])
+                        params = {"date": date_str, "type": 2}
+                        validators = self.cache_store.load_search_cache_validators(cache_key)
+                        data, new_validators = await self._request_json(
+                            "/documents.json", params, validators=validators
+                        )
+                        if data is None:
+                            # 304: 前回から変わっていないので期限切れキャッシュを再保存して使う
+                            documents = self._load_stale_search_cache(cache_key)
+                            if documents is not None:
+                                self._save_search_cache(cache_key, documents)
+                                return documents
+                            data, new_validators = await self._request_json("/documents.json", params)
+                        documents = (data or {}).get("results", [])
                         self._save_search_cache(cache_key, documents)
+                        self.cache_store.save_search_cache_validators(cache_key, new_validators)
                         return documents
                     except Exception:
                         # API 失敗時は期限切れキャッシュをフォールバックとして使う
@@ -248,7 +287,9 @@ class EdinetAPIClient:
         required_through_date = min(year_end, today)
         required_through = required_through_date.strftime("%Y-%m-%d")
 
-        cached = self.cache_store.load_document_index(
+        # 数十MBになりうる年次インデックスの読込・JSON解析でイベントループを止めない
+        cached = await asyncio.to_thread(
+            self.cache_store.load_document_index,
             year,
             required_through=required_through,
             allow_stale=True,
@@ -268,7 +309,7 @@ class EdinetAPIClient:
                 return cached
 
             try:
-                with self.cache_store.file_lock(f"document_index_{year}"):
+                async with self.cache_store.async_file_lock(f"document_index_{year}"):
                     cached = self.cache_store.load_document_index(
                         year,
                         required_through=required_through,
@@ -303,7 +344,7 @@ class EdinetAPIClient:
             self._document_index_locks[year] = asyncio.Lock()
         async with self._document_index_locks[year]:
             try:
-                with self.cache_store.file_lock(f"document_index_{year}"):
+                async with self.cache_store.async_file_lock(f"document_index_{year}"):
                     self.cache_store.clear_document_index(year)
                     docs = await self._build_document_index_for_year(year, required_through_date)
                     self.cache_store.save_document_index(year, docs, built_through=required_through)
@@ -331,7 +372,7 @@ class EdinetAPIClient:
             self._document_index_locks[year] = asyncio.Lock()
         async with self._document_index_locks[year]:
             try:
-                with self.cache_store.file_lock(f"document_index_{year}"):
+                async with self.cache_store.async_file_lock(f"document_index_{year}"):
                     cached_info = self.cache_store.load_document_index_info(
                         year,
                         required_through=required_through,
@@ -387,33 +428,154 @@ class EdinetAPIClient:
 
         return await self._get_documents_for_date_range_daily(start, end)
 
+    async def find_latest_document(
+        self,
+        start: date,
+        end: date,
+        predicate: Callable[[dict[str, Any]], bool],
+        *,
+        sec_code_prefix: str | None = None,
+    ) -> dict[str, Any] | None:
+        """start〜end を新しい日付から順に調べ、predicate を満たす最初の書類を返す。
+
+        日別一覧で引く短い範囲では新しい日付から取得を始め、見つかった時点で
+        まだ終わっていない古い日付の取得を取り消す（上限待ちの日付は HTTP を発行しない）。
+        年次インデックスで引く広い範囲では、sec_code_prefix（証券コード4桁）を渡すと
+        その銘柄の書類だけを調べる（predicate はその銘柄の書類に限って判定する前提）。
+        """
+        if start > end:
+            return None
+
+        if (end - start).days + 1 >= EDINET_DOCUMENT_INDEX_MIN_RANGE_DAYS:
+            if sec_code_prefix is not None:
+                try:
+                    return await self._find_latest_indexed_document_for_code(start, end, predicate, sec_code_prefix)
+                except Exception as e:
+                    logger.warning(f"[EDINET] document index fallback to date range scan: {e}")
+            docs_by_date = await self.get_documents_for_date_range(start, end)
+            for date_str in reversed(docs_by_date):
+                for doc in docs_by_date[date_str]:
+                    if predicate(doc):
+                        return doc
+            return None
+
+        semaphore = asyncio.Semaphore(EDINET_DOCUMENT_INDEX_BATCH_SIZE)
+
+        async def fetch(date_str: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._get_documents_for_date(date_str)
+
+        tasks = [asyncio.ensure_future(fetch(d)) for d in reversed(_iso_date_range(start, end))]
+        try:
+            for task in tasks:
+                for doc in await task:
+                    if predicate(doc):
+                        return doc
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def find_documents(
+        self,
+        start: date,
+        end: date,
+        predicate: Callable[[dict[str, Any]], bool],
+        *,
+        newest_first: bool = False,
+    ) -> list[dict[str, Any]]:
+        """start〜end の書類のうち predicate を満たすものを日付順（同日内は一覧順）に返す。
+
+        年次インデックスで引く広い範囲では、範囲内の全書類を複製せず一致した書類だけを複製する。
+        """
+        if start > end:
+            return []
+
+        if (end - start).days + 1 >= EDINET_DOCUMENT_INDEX_MIN_RANGE_DAYS:
+            try:
+                return await self._find_indexed_documents(start, end, predicate, newest_first=newest_first)
+            except Exception as e:
+                logger.warning(f"[EDINET] document index fallback to daily cache: {e}")
+
+        docs_by_date = await self._get_documents_for_date_range_daily(start, end)
+        date_strs = reversed(docs_by_date) if newest_first else iter(docs_by_date)
+        return [doc for date_str in date_strs for doc in docs_by_date[date_str] if predicate(doc)]
+
+    async def _find_indexed_documents(
+        self,
+        start: date,
+        end: date,
+        predicate: Callable[[dict[str, Any]], bool],
+        *,
+        newest_first: bool,
+    ) -> list[dict[str, Any]]:
+        views = [
+            self._document_index_view(year, await self.ensure_document_index_for_year(year))
+            for year in range(start.year, end.year + 1)
+        ]
+        date_strs = _iso_date_range(start, end)
+        matches: list[dict[str, Any]] = []
+        for date_str in reversed(date_strs) if newest_first else date_strs:
+            for view in views:
+                for doc in view.by_date.get(date_str, ()):
+                    if predicate(doc):
+                        matches.append(_strip_index_metadata(doc))
+        return matches
+
+    async def _find_latest_indexed_document_for_code(
+        self,
+        start: date,
+        end: date,
+        predicate: Callable[[dict[str, Any]], bool],
+        sec_code_prefix: str,
+    ) -> dict[str, Any] | None:
+        start_str = start.isoformat()
+        end_str = end.isoformat()
+        latest: tuple[str, dict[str, Any]] | None = None
+        for year in range(start.year, end.year + 1):
+            view = self._document_index_view(year, await self.ensure_document_index_for_year(year))
+            for date_str, doc in view.by_sec_code.get(sec_code_prefix, ()):
+                if not start_str <= date_str <= end_str:
+                    continue
+                if (latest is None or date_str > latest[0]) and predicate(doc):
+                    latest = (date_str, doc)
+        return _strip_index_metadata(latest[1]) if latest is not None else None
+
     async def _build_document_index_for_year(
         self,
         year: int,
         required_through: date,
     ) -> list[dict[str, Any]]:
-        dates = [
-            date(year, 1, 1) + timedelta(days=offset)
-            for offset in range((required_through - date(year, 1, 1)).days + 1)
-        ]
+        list_dates = _iso_date_range(date(year, 1, 1), required_through)
 
         documents: list[dict[str, Any]] = []
-        for i in range(0, len(dates), EDINET_DOCUMENT_INDEX_BATCH_SIZE):
-            batch = dates[i: i + EDINET_DOCUMENT_INDEX_BATCH_SIZE]
-            responses = await asyncio.gather(
-                *[self._get_documents_for_date(d.strftime("%Y-%m-%d")) for d in batch],
-                return_exceptions=True,
-            )
-            for d, res in zip(batch, responses):
-                if isinstance(res, BaseException):
-                    continue
-                list_date = d.strftime("%Y-%m-%d")
-                for doc in res:
-                    indexed_doc = dict(doc)
-                    indexed_doc["_edinet_list_date"] = list_date
-                    documents.append(indexed_doc)
+        responses = await self._get_documents_for_dates(list_dates)
+        for list_date, res in zip(list_dates, responses):
+            if isinstance(res, BaseException):
+                continue
+            for doc in res:
+                indexed_doc = dict(doc)
+                indexed_doc["_edinet_list_date"] = list_date
+                documents.append(indexed_doc)
         return documents
 
+    async def _get_documents_for_dates(
+        self,
+        list_dates: Sequence[str],
+    ) -> list[list[dict[str, Any]] | BaseException]:
+        """複数日付の書類一覧を同時実行数 EDINET_DOCUMENT_INDEX_BATCH_SIZE で取得する（入力順で返す）。
+
+        固定バッチごとに最も遅い日付を待つのではなく、1件終わるたびに次の日付を開始する。
+        """
+        semaphore = asyncio.Semaphore(EDINET_DOCUMENT_INDEX_BATCH_SIZE)
+
+        async def fetch(date_str: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._get_documents_for_date(date_str)
+
+        return await asyncio.gather(*[fetch(d) for d in list_dates], return_exceptions=True)
+
     async def _get_documents_for_date_range_from_index(
         self,
         start: date,
@@ -421,24 +583,46 @@ class EdinetAPIClient:
     ) -> dict[str, list[dict[str, Any]]]:
         result = _empty_date_range(start, end)
         for year in range(start.year, end.year + 1):
-            for doc in await self.ensure_document_index_for_year(year):
-                doc_date = _document_list_date(doc)
-                if doc_date is None or doc_date < start or doc_date > end:
-                    continue
-                result[doc_date.strftime("%Y-%m-%d")].append(_strip_index_metadata(doc))
+            by_date = self._document_index_view(year, await self.ensure_document_index_for_year(year)).by_date
+            for date_str, docs in result.items():
+                for doc in by_date.get(date_str, ()):
+                    docs.append(_strip_index_metadata(doc))
         return result
 
+    def _document_index_view(self, year: int, documents: list[dict[str, Any]]) -> "_DocumentIndexView":
+        """年次インデックスを提出日ごと・証券コード4桁ごとに束ねる。同じインデックス（同一リスト）なら前回の結果を再利用する。
+
+        探索の各段階・各年度・各銘柄が重なる範囲を何度も引くため、範囲ごとに年全体を走査・日付解析しない。
+        """
+        view = self._document_index_views.get(year)
+        if view is not None and view.documents is documents:
+            return view
+        by_date: dict[str, list[dict[str, Any]]] = {}
+        by_sec_code: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        for doc in documents:
+            doc_date = _document_list_date(doc)
+            if doc_date is None:
+                continue
+            date_str = doc_date.isoformat()
+            by_date.setdefault(date_str, []).append(doc)
+            sec_code = str(doc.get("secCode") or "").strip()
+            if sec_code:
+                by_sec_code.setdefault(sec_code[:4], []).append((date_str, doc))
+        view = _DocumentIndexView(documents, by_date, by_sec_code)
+        self._document_index_views[year] = view
+        return view
+
     async def _get_documents_for_date_range_daily(
         self,
         start: date,
         end: date,
     ) -> dict[str, list[dict[str, Any]]]:
+        list_dates = _iso_date_range(start, end)
         result: dict[str, list[dict[str, Any]]] = {}
-        curr = start
-        while curr <= end:
-            date_str = curr.strftime("%Y-%m-%d")
-            result[date_str] = await self._get_documents_for_date(date_str)
-            curr += timedelta(days=1)
+        for date_str, res in zip(list_dates, await self._get_documents_for_dates(list_dates)):
+            if isinstance(res, BaseException):
+                raise res
+            result[date_str] = res
         return result
 
     async def download_document(self, doc_id: str, doc_type: int = 1, save_dir: Path | None = None) -> Path | None:
@@ -493,6 +677,91 @@ def _resolve_ca_bundle_file() -> Path | None:
     return None
 
 
+@dataclass(frozen=True)
+class _DocumentIndexView:
+    """年次インデックスの参照用グループ化（元リスト・提出日別・証券コード4桁別）"""
+    documents: list[dict[str, Any]]
+    by_date: dict[str, list[dict[str, Any]]]
+    by_sec_code: dict[str, list[tuple[str, dict[str, Any]]]]
+
+
+class _AdaptiveConcurrencyLimiter:
+    """同時実行数を AIMD で調整する非同期リミッタ。
+
+    429/5xx を受けたら上限を半減し、連続成功が EDINET_CONCURRENCY_RECOVERY_SUCCESSES 回続くたびに
+    1 ずつ戻す（最大 max_limit）。リトライ待ちが連鎖して並列化の効果を打ち消すのを防ぐ。
+    同時に走っていたリクエストがまとめて失敗しても、次に成功するまでは1回しか半減しない。
+    """
+
+    def __init__(self, max_limit: int) -> None:
+        self.max_limit = max_limit
+        self.limit = max_limit
+        self._active = 0
+        self._success_streak = 0
+        self._backed_off = False
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    def record_success(self) -> None:
+        self._backed_off = False
+        self._success_streak += 1
+        if self._success_streak >= EDINET_CONCURRENCY_RECOVERY_SUCCESSES and self.limit < self.max_limit:
+            self.limit += 1
+            self._success_streak = 0
+
+    def record_throttled(self) -> None:
+        self._success_streak = 0
+        if self._backed_off or self.limit <= 1:
+            return
+        self._backed_off = True
+        self.limit = max(1, self.limit // 2)
+        logger.info(f"[EDINET] 同時取得数を {self.limit} に下げます")
+
+
+def _conditional_headers(validators: dict[str, str]) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _response_validators(headers: Mapping[str, str]) -> dict[str, str]:
+    validators: dict[str, str] = {}
+    for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+        value = headers.get(header)
+        if value:
+            validators[key] = value
+    return validators
+
+
+def _is_retryable_error(error: BaseException) -> bool:
+    """429/5xx と接続失敗を再試行対象とする。"""
+    return getattr(error, "status", None) in _RETRYABLE_STATUSES or isinstance(error, aiohttp.ClientConnectorError)
+
+
+async def _wait_before_retry(attempt: int, max_retries: int, retry_wait_seconds: float | None) -> None:
+    """サーバー指定の待機秒数があればそれを、なければ full jitter のバックオフ秒数だけ待つ。"""
+    wait_time = retry_wait_seconds if retry_wait_seconds is not None else _backoff_seconds(attempt)
+    logger.warning(f"⚠️ [EDINET API] Retry attempt {attempt+1}/{max_retries} after {wait_time:.1f}s...")
+    await asyncio.sleep(wait_time)
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """full jitter の指数バックオフ秒数。並列取得が同じ間隔で一斉に再試行しないよう 0〜上限で散らす。"""
+    return random.uniform(0, min(EDINET_RETRY_BACKOFF_CAP_SECONDS, 2 ** attempt))
+
+
 def _retry_after_seconds(error: BaseException) -> float | None:
     headers = getattr(error, "headers", None)
     retry_after = headers.get("Retry-After") if headers is not None else None
@@ -503,31 +772,44 @@ def _retry_after_seconds(error: BaseException) -> float | None:
             pass
 
     message = str(getattr(error, "message", "")) or str(error)
-    match = re.search(r"try again in\s+(\d+(?:\.\d+)?)\s+seconds", message, re.IGNORECASE)
+    match = _RETRY_AFTER_MESSAGE_RE.search(message)
     if match:
         return float(match.group(1))
     return None
 
 
 def _document_list_date(doc: dict[str, Any]) -> date | None:
-    list_date = normalize_date_format(str(doc.get("_edinet_list_date") or ""))
-    if list_date:
-        parsed = parse_date_string(list_date)
-        if parsed is not None:
-            return parsed.date()
-    submit_date = normalize_date_format(str(doc.get("submitDateTime") or ""))
-    if not submit_date:
-        return None
-    parsed = parse_date_string(submit_date)
+    list_date = _parse_document_date(doc.get("_edinet_list_date"))
+    if list_date is not None:
+        return list_date
+    return _parse_document_date(doc.get("submitDateTime"))
+
+
+def _parse_document_date(value: object) -> date | None:
+    """EDINET の日付（通常 YYYY-MM-DD / YYYY-MM-DD hh:mm）を date にする。
+
+    年次インデックスの全書類に対して呼ばれるため、定型は strptime を通さず先頭の YYYY-MM-DD を直接解析する。
+    """
+    text = str(value or "")
+    if len(text) >= DATE_LEN_HYPHENATED and text[4] == "-" and text[7] == "-":
+        parsed = parse_hyphenated_date(text[:DATE_LEN_HYPHENATED])
+        return parsed.date() if parsed is not None else None
+    normalized = normalize_date_format(text)
+    parsed = parse_date_string(normalized) if normalized else None
     return parsed.date() if parsed is not None else None
 
 
 def _empty_date_range(start: date, end: date) -> dict[str, list[dict[str, Any]]]:
-    days = (end - start).days + 1
-    return {
-        (start + timedelta(days=offset)).strftime("%Y-%m-%d"): []
-        for offset in range(days)
-    }
+    return {date_str: [] for date_str in _iso_date_range(start, end)}
+
+
+@lru_cache(maxsize=256)
+def _iso_date_range(start: date, end: date) -> tuple[str, ...]:
+    """start〜end（両端含む）の日付を YYYY-MM-DD 文字列で返す（探索の各段階で同じ範囲を繰り返し使うためメモ化）"""
+    return tuple(
+        (start + timedelta(days=offset)).isoformat()
+        for offset in range((end - start).days + 1)
+    )
 
 
 def _merge_document_index_docs(
@@ -2,6 +2,7 @@ EDINET_API_BASE_URL = "https://api.edinet-fsa.go.jp/api/v2"
 EDINET_SEARCH_EMPTY_TTL_DAYS = 1
 EDINET_SEARCH_HIT_TTL_DAYS = 30
 EDINET_SEARCH_PAST_TTL_DAYS = 3650
+EDINET_SEARCH_VALIDATORS_DIRNAME = "search_validators"  # 日別検索結果の HTTP 検証子（search_*.json と同名で保存）
 EDINET_DOCUMENT_INDEX_VERSION = "edinet-doc-index-v1"
 EDINET_DOCUMENT_INDEX_BATCH_SIZE = 2
 EDINET_DOCUMENT_INDEX_MIN_RANGE_DAYS = 30
@@ -12,6 +13,7 @@ ANALYZE_DEFAULT_YEARS = 6
 EDINET_DOC_DISCOVERY_LIMIT  = 10  # 探索・キャッシュ保持の固定上限
 EDINET_DOC_DISCOVERY_BUFFER = 2   # 有効レコード不足時の遡及バッファ
 EDINET_XBRL_MAX_BYTES = 2 * 1024 ** 3  # 2 GB
+EDINET_XBRL_SKIPPED_SUFFIXES = (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".pdf")  # 解析で読まない同梱ファイル
 EDINET_DOC_TYPE_ANNUAL_REPORT = "120"
 EDINET_DOC_TYPE_AMENDMENT = "130"
 EDINET_DOC_TYPE_QUARTERLY_REPORT = "140"
@@ -20,6 +22,11 @@ EDINET_CACHE_LOCK_POLL_SECONDS = 0.2
 EDINET_CACHE_LOCK_NOTICE_SECONDS = 1.0
 EDINET_CACHE_LOCK_STALE_SECONDS = 10 * 60
 EDINET_CACHE_LOCK_TIMEOUT_SECONDS = 3 * 60
+EDINET_MAX_CONCURRENT_REQUESTS = 10       # 日別一覧の同時取得数（= ホスト当たり接続数の上限）
+EDINET_CONCURRENCY_RECOVERY_SUCCESSES = 100  # 429/5xx で絞った同時取得数を1増やすまでの連続成功数
+EDINET_RETRY_BACKOFF_CAP_SECONDS = 30.0    # リトライ待機（full jitter）の上限
+EDINET_HTTP_KEEPALIVE_SECONDS = 60        # 探索の段階間でも接続を再利用できるよう長めに保持
+EDINET_HTTP_DNS_CACHE_SECONDS = 300
 SSL_CERT_FILE_ENV = "SSL_CERT_FILE"
 SSL_CA_BUNDLE_CANDIDATES = (
     "/opt/homebrew/etc/openssl@3/cert.pem",
@@ -11,11 +11,13 @@ from typing import Any, cast
 from collections.abc import Callable, Iterator, Sequence
 
 from blue_ticker.api.edinet_client import EdinetAPIClient
+from blue_ticker.constants.api import EDINET_DOC_DISCOVERY_BUFFER
 from blue_ticker.infrastructure.settings import settings_store
 from blue_ticker.constants.financial import PERCENT, MILLION_YEN, NOPAT_FALLBACK_TAX_RATE, NOPAT_MIN_NORMAL_TAX_RATE, NOPAT_MAX_NORMAL_TAX_RATE
 from blue_ticker.analysis.calculator import calculate_metrics_flexible
 from blue_ticker.utils.cache import CacheManager
 from blue_ticker.utils.cache_paths import edinet_cache_dir
+from blue_ticker.utils.financial_data import extract_annual_data
 from blue_ticker.utils.operating_profit_change import (
     apply_operating_profit_change_from_xbrl,
     apply_operating_profit_change_to_years,
@@ -735,8 +737,6 @@ class IndividualAnalyzer:
         annual_context: XbrlBuildContext | None = None
 
         if prefetched_stock_info is not None and prefetched_financial_data is not None:
-            from blue_ticker.utils.financial_data import extract_annual_data
-
             try:
                 annual_data = extract_annual_data(financial_data, include_2q=include_2q)
             except Exception as e:
@@ -744,7 +744,6 @@ class IndividualAnalyzer:
                 return {}
 
         if not annual_data:
-            from blue_ticker.constants.api import EDINET_DOC_DISCOVERY_BUFFER
             fallback_years = analysis_years or max_documents
             annual_context = await self._edinet_fetcher.build_xbrl_annual_context(
                 code,
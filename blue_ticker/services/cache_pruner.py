@@ -10,7 +10,7 @@ from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 
-from blue_ticker.constants.api import EDINET_DOCUMENT_INDEX_KEEP_YEARS
+from blue_ticker.constants.api import EDINET_DOCUMENT_INDEX_KEEP_YEARS, EDINET_SEARCH_VALIDATORS_DIRNAME
 from blue_ticker.utils.cache import CacheManager
 from blue_ticker.utils.cache_paths import derived_cache_dir, edinet_cache_dir, external_cache_dir
 
@@ -211,6 +211,8 @@ class CachePruner:
             for path in files:
                 if path.exists():
                     path.unlink()
+                # 対応する HTTP 検証子も消す（残すと次回の条件付き GET が 304 になり再取得が1回増える）
+                (self.edinet_dir / EDINET_SEARCH_VALIDATORS_DIRNAME / path.name).unlink(missing_ok=True)
         return PruneSummary(
             removed_files=len(files),
             freed_bytes=freed,
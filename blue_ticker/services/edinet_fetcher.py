@@ -9,6 +9,7 @@ import logging
 import time
 from collections.abc import AsyncGenerator, Callable
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Any, TypeAlias, TypedDict, cast
 
@@ -27,7 +28,7 @@ from blue_ticker.utils.edinet_discovery import (
     build_document_index_for_code,
     build_half_year_document_index_for_code,
 )
-from blue_ticker.utils.fiscal_year import format_document_date
+from blue_ticker.utils.fiscal_year import format_document_date, parse_date_string
 from blue_ticker.utils.xbrl_result_types import (
     CashFlowResult,
     GrossProfitResult,
@@ -248,17 +249,14 @@ class EdinetFetcher:
         max_years: int,
     ) -> list[dict[str, Any]]:
         """2Qレコードを抽出し、年度末ごとに最新開示日へ集約する。"""
-        from datetime import datetime as _dt
-        from blue_ticker.utils.fiscal_year import parse_date_string as _parse
-
-        now = _dt.now()
+        now = datetime.now()
         q2_records_raw: list[dict[str, Any]] = []
         for record in financial_data:
             if record.get("CurPerType") != "2Q":
                 continue
             disc_date = record.get("DiscDate", "")
             if disc_date:
-                dt = _parse(disc_date)
+                dt = parse_date_string(disc_date)
                 if dt and dt > now:
                     continue
             q2_records_raw.append(record)
@@ -345,7 +343,7 @@ class EdinetFetcher:
             doc for doc in docs if doc.get("docTypeCode") == EDINET_DOC_TYPE_ANNUAL_REPORT
         ]
         if annual_reports:
-            return sorted(annual_reports, key=lambda x: x.get("submitDateTime", ""), reverse=True)[0]
+            return max(annual_reports, key=lambda x: x.get("submitDateTime", ""))
         return None
 
     async def predownload_and_parse(
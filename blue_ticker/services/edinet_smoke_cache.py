@@ -165,7 +165,7 @@ def _latest_annual_doc(docs: list[dict[str, Any]]) -> dict[str, Any] | None:
     ]
     if not annual:
         return None
-    return sorted(annual, key=lambda doc: str(doc.get("submitDateTime") or ""), reverse=True)[0]
+    return max(annual, key=lambda doc: str(doc.get("submitDateTime") or ""))
 
 
 def _fy_end(doc: dict[str, Any]) -> str | None:
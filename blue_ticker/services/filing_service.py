@@ -18,6 +18,7 @@ from .edinet_fetcher import EdinetFetcher
 
 _CACHE_VERSION = __version__
 _XBRL_SECTIONS_CACHE_PREFIX = "xbrl_sections_"
+_SPECIAL_SECTIONS_CACHE_PREFIX = "xbrl_sections_special_"
 
 _SECTION_EXTRACTORS: dict[str, Callable[[Path], Any]] = {
     "segments": extract_segment_info,
@@ -55,12 +56,13 @@ class FilingService:
             tasks.append(edinet_fetcher._search_edinet_half_docs(code, max_years))
 
         results = await asyncio.gather(*tasks)
-        docs: list[dict[str, Any]] = []
-        for batch in results:
-            docs.extend(batch)
-
-        if requested:
-            docs = [doc for doc in docs if doc.get("docTypeCode") in requested]
+        # 種別の絞り込みは結合と同時に行い、重複は docID の seen で採用時に1パスで除く
+        docs = (
+            doc
+            for batch in results
+            for doc in batch
+            if not requested or doc.get("docTypeCode") in requested
+        )
 
         seen: set[str] = set()
         unique_docs: list[dict[str, Any]] = []
@@ -91,6 +93,23 @@ class FilingService:
             {"_cache_version": _CACHE_VERSION, "sections": sections},
         )
 
+    def _load_special_sections_cache(self, doc_id: str) -> dict[str, Any]:
+        if self.cache_manager is None:
+            return {}
+        cached = self.cache_manager.get(f"{_SPECIAL_SECTIONS_CACHE_PREFIX}{doc_id}")
+        if not isinstance(cached, dict) or cached.get("_cache_version") != _CACHE_VERSION:
+            return {}
+        data = cached.get("sections")
+        return dict(data) if isinstance(data, dict) else {}
+
+    def _save_special_sections_cache(self, doc_id: str, sections: dict[str, Any]) -> None:
+        if self.cache_manager is None:
+            return
+        self.cache_manager.set(
+            f"{_SPECIAL_SECTIONS_CACHE_PREFIX}{doc_id}",
+            {"_cache_version": _CACHE_VERSION, "sections": sections},
+        )
+
     async def extract_filing_content(
         self,
         code: str,
@@ -123,7 +142,7 @@ class FilingService:
 
         base = {"doc_id": selected_doc_id, **meta}
         extract_all = sections is None
-        need_special = extract_all or any(s in _SPECIAL_SECTIONS for s in (sections or []))
+        special_sections = [s for s in _SECTION_EXTRACTORS if extract_all or s in (sections or [])]
         xbrl_sections = [s for s in (sections or []) if s not in _SPECIAL_SECTIONS]
         need_xbrl = extract_all or bool(xbrl_sections)
 
@@ -131,18 +150,26 @@ class FilingService:
         if need_xbrl:
             all_xbrl = self._load_xbrl_sections_cache(selected_doc_id)
 
+        # segments / geography も書類単位でキャッシュし、揃っていれば XBRL の取得・解析を省く
+        special_results: dict[str, Any] = {}
+        if special_sections:
+            special_results = self._load_special_sections_cache(selected_doc_id)
+        missing_special = [s for s in special_sections if s not in special_results]
+
         xbrl_dir = None
-        if need_special or (need_xbrl and all_xbrl is None):
+        if missing_special or (need_xbrl and all_xbrl is None):
             xbrl_dir = await self.edinet_client.download_document(selected_doc_id, 1)
             if not xbrl_dir:
                 raise ValueError("Document not found or download failed")
 
         result: dict[str, Any] = {}
 
-        if need_special:
-            for section_id, extractor in _SECTION_EXTRACTORS.items():
-                if extract_all or section_id in sections:  # type: ignore[operator]
-                    result[section_id] = extractor(xbrl_dir)  # type: ignore[arg-type]
+        if missing_special:
+            for section_id in missing_special:
+                special_results[section_id] = _SECTION_EXTRACTORS[section_id](xbrl_dir)  # type: ignore[arg-type]
+            self._save_special_sections_cache(selected_doc_id, special_results)
+        for section_id in special_sections:
+            result[section_id] = special_results[section_id]
 
         if need_xbrl:
             if all_xbrl is None:
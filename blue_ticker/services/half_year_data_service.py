@@ -3,6 +3,7 @@
 """
 
 import asyncio
+import heapq
 import logging
 from collections.abc import Mapping
 from typing import Any
@@ -18,7 +19,7 @@ from blue_ticker.constants.financial import (
     PERCENT,
 )
 from blue_ticker.utils.cache import CacheManager
-from blue_ticker.utils.converters import to_float
+from blue_ticker.utils.converters import to_float, to_float_millions
 from blue_ticker.utils.financial_data import build_half_year_periods
 from blue_ticker.utils.operating_profit_change import (
     apply_operating_profit_change_to_periods,
@@ -162,8 +163,7 @@ def _apply_h1_edinet_data(
 
     ibd_current = ibd_result.get("current")
     h1_ibd_m = ibd_current / MILLION_YEN if ibd_current is not None else None
-    q2_net_assets_raw = to_float(q2_rec.get("NetAssets"))
-    q2_net_assets_m = q2_net_assets_raw / MILLION_YEN if q2_net_assets_raw is not None else None
+    q2_net_assets_m = to_float_millions(q2_rec.get("NetAssets"))
     _apply_nopat_and_roic(data, q2_net_assets_m, h1_ibd_m)
 
     return h1_gp_m, h1_cfo_m, h1_cfi_m
@@ -180,10 +180,8 @@ def _apply_h2_edinet_data(
     """H2期間の派生計算（FY - H1）と補完を適用。"""
     h1_gp_m, h1_cfo_m, h1_cfi_m = h1_carry
 
-    fy_cfo = to_float(fy_rec.get("CFO"))
-    fy_cfi = to_float(fy_rec.get("CFI"))
-    fy_cfo_m = fy_cfo / MILLION_YEN if fy_cfo is not None else None
-    fy_cfi_m = fy_cfi / MILLION_YEN if fy_cfi is not None else None
+    fy_cfo_m = to_float_millions(fy_rec.get("CFO"))
+    fy_cfi_m = to_float_millions(fy_rec.get("CFI"))
     fy_source = "EDINET" if fy_rec.get("_xbrl_source") else "EXTERNAL"
 
     if fy_cfo_m is not None and h1_cfo_m is not None:
@@ -215,8 +213,7 @@ def _apply_h2_edinet_data(
 
     h2_ibd = ibd_by_year.get(fy_end_8)
     h2_ibd_m = h2_ibd["current"] / MILLION_YEN if h2_ibd and h2_ibd.get("current") is not None else None
-    h2_net_assets_raw = to_float(fy_rec.get("NetAssets"))
-    h2_net_assets_m = h2_net_assets_raw / MILLION_YEN if h2_net_assets_raw is not None else None
+    h2_net_assets_m = to_float_millions(fy_rec.get("NetAssets"))
     _apply_nopat_and_roic(data, h2_net_assets_m, h2_ibd_m)
 
 
@@ -239,8 +236,7 @@ def _apply_fy_only_edinet_data(
 
     fy_ibd = ibd_by_year.get(fy_end_8)
     fy_ibd_m = fy_ibd["current"] / MILLION_YEN if fy_ibd and fy_ibd.get("current") is not None else None
-    fy_net_assets_raw = to_float(fy_rec.get("NetAssets"))
-    fy_net_assets_m = fy_net_assets_raw / MILLION_YEN if fy_net_assets_raw is not None else None
+    fy_net_assets_m = to_float_millions(fy_rec.get("NetAssets"))
     _apply_nopat_and_roic(data, fy_net_assets_m, fy_ibd_m)
 
 
@@ -259,7 +255,7 @@ def _trim_half_year_periods(
     current_h1_ends = h1_ends - h2_ends  # H1 はあるが H2 がない = 当期進行中
 
     # 完結ペアを新しい順に N 件選択
-    complete_sorted = sorted(h2_ends, reverse=True)[:years]
+    complete_sorted = heapq.nlargest(years, h2_ends)
     selected = set(complete_sorted)
 
     result = [p for p in periods if p["fy_end"] in selected]
@@ -23,6 +23,9 @@ class MasterDataManager:
         self._is_loaded = False
         self._master_data: list[MasterStock] = []
         self._code_index: dict[str, MasterStock] = {}
+        # 33業種は銘柄数に比べてごく少数なので、一覧と正規化済み業種名をロード時に1回だけ作る
+        self._sectors: list[SectorSummary] = []
+        self._normalized_sector_names: dict[str, str] = {}
         
     def _normalize_name(self, name: str) -> str:
         """
@@ -130,6 +133,7 @@ class MasterDataManager:
                         self._code_index[code + "0"] = item
                     elif len(code) == 5 and code.endswith("0"):
                         self._code_index[code[:4]] = item
+            self._build_sector_index()
             self._is_loaded = True
             logger.info(f"銘柄マスタを更新しました: {len(self._master_data)} 件 (元データ {len(raw_data)} 件)")
             return True
@@ -183,30 +187,43 @@ class MasterDataManager:
             return None
         return self._code_index.get(str(code).strip())
 
-    def list_sectors(self) -> list[SectorSummary]:
-        """33業種の一覧を銘柄数付きで返す"""
-        self.load_if_needed()
+    def _build_sector_index(self) -> None:
+        """業種一覧（銘柄数付き）と業種名 → 正規化名の対応を作る。"""
         counts: dict[str, int] = {}
         names: dict[str, str] = {}
+        normalized_names: dict[str, str] = {}
         for item in self._master_data:
             code = item.get("S33", "")
             name = item.get("S33Nm", "")
+            if name not in normalized_names:
+                normalized_names[name] = self._normalize_name(name)
             if code and name:
                 counts[code] = counts.get(code, 0) + 1
                 names[code] = name
-        return [
+        self._sectors = [
             {"code": c, "name": names[c], "count": counts[c]}
             for c in sorted(counts)
         ]
+        self._normalized_sector_names = normalized_names
+
+    def list_sectors(self) -> list[SectorSummary]:
+        """33業種の一覧を銘柄数付きで返す"""
+        self.load_if_needed()
+        return [sector.copy() for sector in self._sectors]
 
     def search_by_sector(self, sector_query: str, limit: int = 200) -> list[StockSearchResult]:
         """業種名（部分一致）で銘柄一覧を返す"""
         self.load_if_needed()
         query_normalized = self._normalize_name(sector_query)
+        # 一致判定は業種名ごとに1回だけ行い、銘柄ごとの正規化を避ける
+        matching_sectors = {
+            name for name, normalized in self._normalized_sector_names.items()
+            if query_normalized in normalized
+        }
         results: list[StockSearchResult] = []
         for item in self._master_data:
             sector_name = item.get("S33Nm", "")
-            if query_normalized in self._normalize_name(sector_name):
+            if sector_name in matching_sectors:
                 results.append({
                     "code": item.get("Code", ""),
                     "name": item.get("CoName", ""),
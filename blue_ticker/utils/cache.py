@@ -30,6 +30,15 @@ class _NumpyEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """ファイルの (mtime_ns, size)。存在しなければ None。"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 class CacheManager:
     """
     キャッシュ管理クラス
@@ -66,6 +75,8 @@ class CacheManager:
             ttl_days: キャッシュ有効期限（日数、デフォルト: 7）
         """
         self._metadata_cache: dict[str, str] | None = None
+        # _metadata_cache と一致するディスク上の metadata.json の (mtime_ns, size)
+        self._metadata_signature: tuple[int, int] | None = None
         self.ttl_days = ttl_days
         self.cache_dir = Path(cache_dir)
         self.data_dir = derived_cache_dir(self.cache_dir)
@@ -77,6 +88,7 @@ class CacheManager:
         self.cache_dir = Path(cache_dir)
         self.data_dir = derived_cache_dir(self.cache_dir)
         self._metadata_cache = None
+        self._metadata_signature = None
     
     def _get_cache_file_path(self, key: str) -> Path:
         """キャッシュファイルのパスを取得"""
@@ -114,13 +126,16 @@ class CacheManager:
         metadata_path = self._get_metadata_file_path()
         if metadata_path.exists():
             try:
+                signature = _file_signature(metadata_path)
                 with open(metadata_path, "r", encoding="utf-8") as f:
                     data: dict[str, str] = json.load(f)
                     self._metadata_cache = data
+                    self._metadata_signature = signature
                     return data
             except (json.JSONDecodeError, IOError):
                 pass
         self._metadata_cache = {}
+        self._metadata_signature = None
         return self._metadata_cache
 
     def _save_metadata(self, metadata: dict[str, str], *, replace: bool = False) -> None:
@@ -129,6 +144,7 @@ class CacheManager:
         replace=False（デフォルト / set 用）:
             ディスクから最新を再読み込みして metadata をマージしてから保存する。
             同一 cache_dir を指す複数インスタンス間の lost update を防ぐ。
+            前回の読み書きからファイルが変わっていなければ（mtime・サイズが同じ）再読み込みを省く。
 
         replace=True（clear 用）:
             metadata をそのまま保存する。呼び出し元でディスク再読み込み済みであること。
@@ -136,7 +152,11 @@ class CacheManager:
         """
         metadata_path = self._get_metadata_file_path()
         metadata_path.parent.mkdir(parents=True, exist_ok=True)
-        if replace:
+        if replace or (
+            metadata is self._metadata_cache
+            and self._metadata_signature is not None
+            and _file_signature(metadata_path) == self._metadata_signature
+        ):
             to_write = metadata
         else:
             on_disk: dict[str, str] = {}
@@ -150,9 +170,10 @@ class CacheManager:
             to_write = on_disk
         tmp = metadata_path.with_name(f".metadata.{uuid.uuid4().hex}.tmp")
         with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(to_write, f, ensure_ascii=False, indent=2)
+            json.dump(to_write, f, ensure_ascii=False, separators=(",", ":"))
         tmp.replace(metadata_path)
         self._metadata_cache = to_write
+        self._metadata_signature = _file_signature(metadata_path)
     
     def get(self, key: str) -> Any | None:
         """
@@ -167,13 +188,7 @@ class CacheManager:
         if not self.enabled:
             return None
 
-        cache_file = self._get_cache_file_path(key)
-        if not cache_file.exists():
-            legacy_cache_file = self._get_legacy_cache_file_path(key)
-            if not legacy_cache_file.exists():
-                return None
-            cache_file = legacy_cache_file
-
+        # 有効期限はメモリ上のメタデータで先に判定し、期限切れならファイルに触れない
         with self._meta_lock:
             metadata = self._load_metadata()
             cache_date = metadata.get(key)
@@ -189,12 +204,19 @@ class CacheManager:
             except (ValueError, TypeError):
                 return None
         
-        # キャッシュファイルを読み込み
-        try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return None
+        # キャッシュファイルを読み込み（exists() で事前確認せず、無ければ旧配置を試す）
+        for cache_file in (self._get_cache_file_path(key), self._get_legacy_cache_file_path(key)):
+            try:
+                raw = cache_file.read_bytes()
+            except FileNotFoundError:
+                continue
+            except IOError:
+                return None
+            try:
+                return json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                return None
+        return None
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -210,11 +232,11 @@ class CacheManager:
         cache_file = self._get_cache_file_path(key)
         cache_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # データを保存
+        # データを保存（json.dump はチャンク毎に write するため、文字列化してから1回で書く）
         try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(value, f, ensure_ascii=False, cls=_NumpyEncoder)
-        except (TypeError, IOError) as e:
+            payload = json.dumps(value, ensure_ascii=False, separators=(",", ":"), cls=_NumpyEncoder)
+            cache_file.write_bytes(payload.encode("utf-8"))
+        except (TypeError, ValueError, IOError) as e:
             # キャッシュ保存に失敗しても処理は続行
             logger.warning(f"キャッシュの保存に失敗しました: {e}")
             return
@@ -231,12 +253,42 @@ class CacheManager:
             return sorted(self._load_metadata().keys())
 
     def clear_prefix(self, prefix: str) -> int:
-        """指定 prefix で始まるキャッシュを削除し、削除件数を返す。"""
-        keys = [key for key in self.keys() if key.startswith(prefix)]
-        for key in keys:
-            self.clear(key)
+        """指定 prefix で始まるキャッシュを削除し、削除件数を返す。
+
+        metadata.json の読み込みと書き戻しは該当キー全体で1回だけ行う。
+        """
+        with self._meta_lock:
+            keys = [key for key in self._load_metadata() if key.startswith(prefix)]
+        self._remove_entries(keys)
         return len(keys)
     
+    def _remove_entries(self, keys: list[str]) -> None:
+        """指定キーのキャッシュファイルとメタデータを削除する。"""
+        if not keys:
+            return
+        for key in keys:
+            cache_file = self._get_cache_file_path(key)
+            if cache_file.exists():
+                cache_file.unlink()
+            legacy_cache_file = self._get_legacy_cache_file_path(key)
+            if legacy_cache_file.exists():
+                legacy_cache_file.unlink()
+
+        with self._meta_lock:
+            # _load_metadata() は in-memory キャッシュが stale な場合があるため、
+            # ディスクから直接読み込んで削除し、replace=True で保存する。
+            metadata_path = self._get_metadata_file_path()
+            on_disk: dict[str, str] = {}
+            if metadata_path.exists():
+                try:
+                    with open(metadata_path, "r", encoding="utf-8") as f:
+                        on_disk = json.load(f)
+                except (json.JSONDecodeError, IOError):
+                    pass
+            for key in keys:
+                on_disk.pop(key, None)
+            self._save_metadata(on_disk, replace=True)
+
     async def async_get(self, key: str) -> Any | None:
         """非同期コンテキスト用の get ラッパー。ファイルI/O をスレッドプールに委譲する。"""
         return await asyncio.to_thread(self.get, key)
@@ -253,26 +305,7 @@ class CacheManager:
             key: クリアするキャッシュキー。Noneの場合は全キャッシュをクリア
         """
         if key:
-            cache_file = self._get_cache_file_path(key)
-            if cache_file.exists():
-                cache_file.unlink()
-            legacy_cache_file = self._get_legacy_cache_file_path(key)
-            if legacy_cache_file.exists():
-                legacy_cache_file.unlink()
-
-            with self._meta_lock:
-                # _load_metadata() は in-memory キャッシュが stale な場合があるため、
-                # ディスクから直接読み込んで削除し、replace=True で保存する。
-                metadata_path = self._get_metadata_file_path()
-                on_disk: dict[str, str] = {}
-                if metadata_path.exists():
-                    try:
-                        with open(metadata_path, "r", encoding="utf-8") as f:
-                            on_disk = json.load(f)
-                    except (json.JSONDecodeError, IOError):
-                        pass
-                on_disk.pop(key, None)
-                self._save_metadata(on_disk, replace=True)
+            self._remove_entries([key])
         else:
             # 全キャッシュをクリア
             if self.data_dir.exists():
@@ -283,6 +316,7 @@ class CacheManager:
                 if metadata_path.exists():
                     metadata_path.unlink()
                 self._metadata_cache = None
+                self._metadata_signature = None
 
 
 
@@ -9,6 +9,7 @@ import logging
 from typing import Any
 from datetime import datetime
 
+from blue_ticker.constants.financial import MILLION_YEN
 from blue_ticker.constants.formats import DATE_LEN_COMPACT, DATE_LEN_HYPHENATED
 from blue_ticker.utils.fiscal_year import normalize_date_format, parse_date_string
 
@@ -52,6 +53,22 @@ def to_float(value: str | float | int | None) -> float | None:
     return None
 
 
+def to_float_millions(value: str | float | int | None) -> float | None:
+    """
+    値をfloatに変換し、円単位から百万円単位に換算
+
+    Args:
+        value: 変換する値（None、数値、文字列など）
+
+    Returns:
+        百万円単位のfloat値。変換できない場合はNone
+    """
+    result = to_float(value)
+    if result is None:
+        return None
+    return result / MILLION_YEN
+
+
 def to_int(value: str | float | int | None) -> int | None:
     """
     値をintに変換
@@ -129,17 +146,15 @@ def is_valid_value(value: Any) -> bool:
         return False
     if value == "":
         return False
-    if is_nan(value):
-        return False
-    
-    # 数値に変換して0チェック
+
+    # 数値に変換して NaN・0 チェック（is_nan と同じ float 変換を1回で済ませる）
     try:
         num_value = float(value)
-        if math.isnan(num_value):
-            return False
-        return num_value != 0
     except (ValueError, TypeError):
         return False
+    if math.isnan(num_value):
+        return False
+    return num_value != 0
 
 
 def is_valid_financial_record(record: dict[str, Any]) -> bool:
@@ -223,7 +238,13 @@ def parse_date(date_str: str) -> datetime | None:
         return None
     
     date_str = date_str.strip()
-    
+
+    # 定型（YYYYMMDD / YYYY-MM-DD）は正規関数で解析する
+    if len(date_str) in (DATE_LEN_COMPACT, DATE_LEN_HYPHENATED):
+        parsed = parse_date_string(date_str)
+        if parsed is not None:
+            return parsed
+
     # 複数の形式を試す
     formats = [
         "%Y-%m-%d",      # YYYY-MM-DD
@@ -232,10 +253,10 @@ def parse_date(date_str: str) -> datetime | None:
         "%Y-%m-%dT%H:%M:%S",  # ISO形式
         "%Y-%m-%d %H:%M:%S",  # 日時形式
     ]
-    
+
     for fmt in formats:
         try:
-            return datetime.strptime(date_str[:len(date_str)], fmt)
+            return datetime.strptime(date_str, fmt)
         except (ValueError, TypeError):
             continue
     
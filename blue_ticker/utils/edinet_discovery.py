@@ -22,6 +22,8 @@ build_document_index_for_code() が主エントリーポイント。
 import asyncio
 import calendar
 import logging
+import re
+from collections.abc import Callable
 from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -35,6 +37,7 @@ logger = logging.getLogger(__name__)
 _ANNUAL_REPORT_DOC_TYPE = "120"
 _AMENDMENT_DOC_TYPE = "130"
 _HALF_YEAR_REPORT_DOC_TYPES = frozenset({"140", "160"})
+_CORRECTION_DESCRIPTION_RE = re.compile("訂正|補正")
 _BATCH_SIZE = 10
 _TIER1_WINDOW_DAYS = 14
 _TIER2_OFFSET_DAYS = 60   # 期末からの期待提出オフセット
@@ -71,6 +74,12 @@ def _add_year_safe(value: date, years: int) -> date:
         return value.replace(year=value.year + years, day=28)
 
 
+def _sec_code_matches(doc: dict[str, Any], code_4digit: str) -> bool:
+    """書類の secCode（5桁）が銘柄コード（4桁）で始まるか。書類種別で絞った後に呼ぶ。"""
+    sec_code = doc.get("secCode")
+    return bool(sec_code) and str(sec_code).strip().startswith(code_4digit)
+
+
 async def _fetch_date_range_cached(
     edinet_client: "EdinetAPIClient",
     start: date,
@@ -108,6 +117,59 @@ async def _fetch_date_range_cached(
     return result
 
 
+async def _find_latest_in_date_range(
+    edinet_client: "EdinetAPIClient",
+    start: date,
+    end: date,
+    predicate: Callable[[dict[str, Any]], bool],
+    *,
+    code_4digit: str | None = None,
+) -> dict[str, Any] | None:
+    """start〜end（含む）を新しい日付から順に調べ、predicate を満たす最初の書類を返す。
+
+    EdinetAPIClient では見つかった時点で残りの日付の取得を打ち切り、code_4digit を渡すと
+    年次インデックスの証券コード別グループだけを調べる。
+    """
+    from blue_ticker.api.edinet_client import EdinetAPIClient
+
+    if isinstance(edinet_client, EdinetAPIClient):
+        sec_code_prefix = code_4digit if code_4digit is not None and len(code_4digit) == 4 else None
+        return await edinet_client.find_latest_document(start, end, predicate, sec_code_prefix=sec_code_prefix)
+
+    docs_by_date = await _fetch_date_range_cached(edinet_client, start, end)
+    for date_str in sorted(docs_by_date.keys(), reverse=True):
+        for doc in docs_by_date[date_str]:
+            if predicate(doc):
+                return doc
+    return None
+
+
+async def _collect_in_date_range(
+    edinet_client: "EdinetAPIClient",
+    start: date,
+    end: date,
+    predicate: Callable[[dict[str, Any]], bool],
+    *,
+    newest_first: bool = False,
+) -> list[dict[str, Any]]:
+    """start〜end（含む）の書類のうち predicate を満たすものを日付順に返す。
+
+    EdinetAPIClient では範囲内の全書類を日付別に組み立てず、一致した書類だけを受け取る。
+    """
+    from blue_ticker.api.edinet_client import EdinetAPIClient
+
+    if isinstance(edinet_client, EdinetAPIClient):
+        return await edinet_client.find_documents(start, end, predicate, newest_first=newest_first)
+
+    docs_by_date = await _fetch_date_range_cached(edinet_client, start, end)
+    return [
+        doc
+        for date_str in sorted(docs_by_date.keys(), reverse=newest_first)
+        for doc in docs_by_date[date_str]
+        if predicate(doc)
+    ]
+
+
 async def _find_most_recent_annual_report(
     code: str,
     edinet_client: "EdinetAPIClient",
@@ -121,23 +183,24 @@ async def _find_most_recent_annual_report(
     code_4digit = code[:4] if len(code) >= 4 else code
     today = datetime.now().date()
     scan_start = today - timedelta(days=scan_days - 1)
-    docs_by_date = await _fetch_date_range_cached(edinet_client, scan_start, today)
 
-    for date_str in sorted(docs_by_date.keys(), reverse=True):
-        for doc in docs_by_date[date_str]:
-            sec = str(doc.get("secCode", "")).strip()
-            if not sec.startswith(code_4digit):
-                continue
-            if doc.get("docTypeCode") != _ANNUAL_REPORT_DOC_TYPE:
-                continue
-            if not doc.get("periodEnd"):
-                continue
-            logger.info(
-                f"[EDINET Discovery] {code}: 直近有報発見 "
-                f"periodEnd={doc.get('periodEnd')} "
-                f"submit={format_document_date(doc.get('submitDateTime'))}"
-            )
-            return doc
+    def is_recent_annual_report(doc: dict[str, Any]) -> bool:
+        return (
+            doc.get("docTypeCode") == _ANNUAL_REPORT_DOC_TYPE
+            and _sec_code_matches(doc, code_4digit)
+            and bool(doc.get("periodEnd"))
+        )
+
+    doc = await _find_latest_in_date_range(
+        edinet_client, scan_start, today, is_recent_annual_report, code_4digit=code_4digit
+    )
+    if doc is not None:
+        logger.info(
+            f"[EDINET Discovery] {code}: 直近有報発見 "
+            f"periodEnd={doc.get('periodEnd')} "
+            f"submit={format_document_date(doc.get('submitDateTime'))}"
+        )
+        return doc
 
     logger.warning(
         f"[EDINET Discovery] {code}: {scan_days}日間スキャンで有価証券報告書が見つかりませんでした"
@@ -164,21 +227,20 @@ async def _find_annual_report_for_fy(
     fy_end_str = fy_end.strftime("%Y-%m-%d")
     today = datetime.now().date()
 
+    def is_target_annual_report(doc: dict[str, Any]) -> bool:
+        return (
+            doc.get("docTypeCode") == _ANNUAL_REPORT_DOC_TYPE
+            and doc.get("periodEnd") == fy_end_str
+            and _sec_code_matches(doc, code_4digit)
+        )
+
     async def _search(start: date, end: date) -> dict[str, Any] | None:
         actual_end = min(end, today)
         if start > actual_end:
             return None
-        docs_by_date = await _fetch_date_range_cached(edinet_client, start, actual_end)
-        for date_str in sorted(docs_by_date.keys(), reverse=True):
-            for doc in docs_by_date[date_str]:
-                if not str(doc.get("secCode", "")).strip().startswith(code_4digit):
-                    continue
-                if doc.get("docTypeCode") != _ANNUAL_REPORT_DOC_TYPE:
-                    continue
-                if doc.get("periodEnd") != fy_end_str:
-                    continue
-                return doc
-        return None
+        return await _find_latest_in_date_range(
+            edinet_client, start, actual_end, is_target_annual_report, code_4digit=code_4digit
+        )
 
     # Tier 1: 前年提出日 ± 2週間
     if prev_submit_date is not None:
@@ -224,21 +286,18 @@ async def _find_amendments(
     if not original_doc_ids:
         return []
 
-    docs_by_date = await _fetch_date_range_cached(edinet_client, search_start, search_end)
-    amendments: list[dict[str, Any]] = []
-
-    for date_str in sorted(docs_by_date.keys()):
-        for doc in docs_by_date[date_str]:
-            if doc.get("docTypeCode") != _AMENDMENT_DOC_TYPE:
-                continue
-            parent_id = doc.get("parentDocID")
-            if parent_id and parent_id in original_doc_ids:
-                amendments.append(doc)
-                logger.info(
-                    f"[EDINET Discovery] 訂正書類: docID={doc.get('docID')} "
-                    f"parentDocID={parent_id}"
-                )
-
+    def is_amendment_of_originals(doc: dict[str, Any]) -> bool:
+        if doc.get("docTypeCode") != _AMENDMENT_DOC_TYPE:
+            return False
+        parent_id = doc.get("parentDocID")
+        return bool(parent_id) and parent_id in original_doc_ids
+
+    amendments = await _collect_in_date_range(edinet_client, search_start, search_end, is_amendment_of_originals)
+    for doc in amendments:
+        logger.info(
+            f"[EDINET Discovery] 訂正書類: docID={doc.get('docID')} "
+            f"parentDocID={doc.get('parentDocID')}"
+        )
     return amendments
 
 
@@ -287,40 +346,41 @@ async def _find_half_report_for_fy(
     if search_start > search_end:
         return None
 
-    docs_by_date = await _fetch_date_range_cached(edinet_client, search_start, search_end)
-    candidates: list[dict[str, Any]] = []
-    for date_str in sorted(docs_by_date.keys(), reverse=True):
-        for doc in docs_by_date[date_str]:
-            if not str(doc.get("secCode", "")).strip().startswith(code_4digit):
-                continue
-            doc_type = doc.get("docTypeCode")
-            if doc_type not in _HALF_YEAR_REPORT_DOC_TYPES:
-                continue
-            desc = str(doc.get("docDescription") or "")
-            if "訂正" in desc or "補正" in desc:
-                continue
-
-            doc_period_end = str(doc.get("periodEnd") or "")
-            doc_period_start = str(doc.get("periodStart") or "")
-            if doc_type == "160":
-                # 半期報告書の一覧メタデータは periodEnd に通期の期末を持つ。
-                if doc_period_end and doc_period_end != fy_end_str:
-                    continue
-                if doc_period_start and doc_period_start != period_start_str:
-                    continue
-            else:
-                # 旧2Q四半期報告書は periodEnd が2Q末、periodStart は第2四半期開始日。
-                if doc_period_end and doc_period_end != half_end_str:
-                    continue
-                if "第2四半期" not in desc:
-                    continue
-            candidates.append(doc)
+    def is_half_report(doc: dict[str, Any]) -> bool:
+        doc_type = doc.get("docTypeCode")
+        if doc_type not in _HALF_YEAR_REPORT_DOC_TYPES:
+            return False
+        if not _sec_code_matches(doc, code_4digit):
+            return False
+        desc = str(doc.get("docDescription") or "")
+        if _CORRECTION_DESCRIPTION_RE.search(desc):
+            return False
+
+        doc_period_end = str(doc.get("periodEnd") or "")
+        doc_period_start = str(doc.get("periodStart") or "")
+        if doc_type == "160":
+            # 半期報告書の一覧メタデータは periodEnd に通期の期末を持つ。
+            if doc_period_end and doc_period_end != fy_end_str:
+                return False
+            if doc_period_start and doc_period_start != period_start_str:
+                return False
+        else:
+            # 旧2Q四半期報告書は periodEnd が2Q末、periodStart は第2四半期開始日。
+            if doc_period_end and doc_period_end != half_end_str:
+                return False
+            if "第2四半期" not in desc:
+                return False
+        return True
+
+    candidates = await _collect_in_date_range(
+        edinet_client, search_start, search_end, is_half_report, newest_first=True
+    )
 
     if not candidates:
         logger.warning(f"[EDINET Discovery] {code} {fy_end_str}: 半期書類が見つかりませんでした")
         return None
 
-    found = sorted(candidates, key=lambda d: str(d.get("submitDateTime") or ""), reverse=True)[0]
+    found = max(candidates, key=lambda d: str(d.get("submitDateTime") or ""))
     _attach_half_metadata(
         found,
         fy_end_str=fy_end_str,
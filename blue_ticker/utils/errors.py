@@ -15,6 +15,14 @@ class DataAvailability(Enum):
     PARTIAL = "partial"  # 一部データのみ
 
 
+def _available_years(metrics: Mapping[str, Any]) -> int:
+    """取得年数。available_years が無い場合だけ years の件数を数える。"""
+    available_years = metrics.get("available_years")
+    if available_years is None:
+        return len(metrics.get("years", []))
+    return available_years
+
+
 def check_data_availability(
     metrics: Mapping[str, Any],
     required_years: int
@@ -29,17 +37,13 @@ def check_data_availability(
     Returns:
         データ取得状況
     """
-    years = metrics.get("years", [])
-    available_years = metrics.get("available_years", len(years))
+    available_years = _available_years(metrics)
     
     if available_years == 0:
         return DataAvailability.NO_DATA
-    elif available_years < required_years:
+    if available_years < required_years:
         return DataAvailability.INSUFFICIENT
-    elif available_years == required_years:
-        return DataAvailability.SUFFICIENT
-    else:
-        return DataAvailability.SUFFICIENT
+    return DataAvailability.SUFFICIENT
 
 
 def get_data_availability_message(
@@ -56,8 +60,7 @@ def get_data_availability_message(
     Returns:
         メッセージ
     """
-    years = metrics.get("years", [])
-    available_years = metrics.get("available_years", len(years))
+    available_years = _available_years(metrics)
     
     if available_years == 0:
         return "データが取得できませんでした"
@@ -82,7 +85,7 @@ def validate_metrics_for_analysis(
         (検証結果, エラーメッセージ)
     """
     years = metrics.get("years", [])
-    available_years = metrics.get("available_years", len(years))
+    available_years = _available_years(metrics)
     
     if available_years < required_years:
         message = get_data_availability_message(metrics, required_years)
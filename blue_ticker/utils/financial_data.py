@@ -2,11 +2,12 @@
 財務データ処理と指標計算モジュール
 """
 
+import heapq
 import logging
 from typing import Any
 from datetime import datetime
 
-from .converters import to_float, is_valid_value, is_valid_financial_record, extract_year_month
+from .converters import to_float, to_float_millions, is_valid_value, is_valid_financial_record, extract_year_month
 from blue_ticker.utils.fiscal_year import parse_date_string
 from blue_ticker.constants.financial import MILLION_YEN
 
@@ -16,7 +17,10 @@ _DedupKey = str | tuple[str, str]
 
 
 def _is_mergeable_value(value: object) -> bool:
-    return is_valid_value(value) or (isinstance(value, str) and value != "")
+    # 空でない文字列は数値変換の成否に関係なくマージ対象なので、float 変換を試みずに判定する
+    if isinstance(value, str):
+        return value != ""
+    return is_valid_value(value)
 
 
 def _merge_record(
@@ -29,27 +33,36 @@ def _merge_record(
 
     有効な値は、そのフィールドに対して最も新しい DiscDate の値を採用する。
     欠損・空・0 は有効値を上書きしない。DiscDate は常に最新値に更新する。
+    キーの最初のレコードはコピーせずに借用し、2件目をマージする時点で初めて
+    コピーとフィールド別の日付表を作る（入力レコード自体は変更しない）。
     """
     disc_date = str(record.get("DiscDate", ""))
-    if key not in seen:
-        seen[key] = record.copy()
-        field_dates[key] = {
-            field: disc_date
-            for field, value in record.items()
-            if _is_mergeable_value(value)
-        }
+    existing = seen.get(key)
+    if existing is None:
+        seen[key] = record
         return
 
-    existing = seen[key]
-    dates = field_dates[key]
+    dates = field_dates.get(key)
+    if dates is None:
+        first_disc_date = str(existing.get("DiscDate", ""))
+        dates = {
+            field: first_disc_date
+            for field, value in existing.items()
+            if _is_mergeable_value(value)
+        }
+        field_dates[key] = dates
+        existing = existing.copy()
+        seen[key] = existing
 
     if disc_date >= str(existing.get("DiscDate", "")):
         existing["DiscDate"] = record.get("DiscDate", existing.get("DiscDate"))
 
+    is_mergeable = _is_mergeable_value
     for field, value in record.items():
-        if field == "DiscDate" or not _is_mergeable_value(value):
+        if field == "DiscDate" or not is_mergeable(value):
             continue
-        if field not in dates or disc_date >= dates[field]:
+        field_date = dates.get(field)
+        if field_date is None or disc_date >= field_date:
             existing[field] = value
             dates[field] = disc_date
 
@@ -62,7 +75,7 @@ def _latest_by_fy_end(
     records: dict[str, dict[str, Any]],
     limit: int,
 ) -> list[str]:
-    return sorted(records.keys(), reverse=True)[:limit]
+    return heapq.nlargest(limit, records)
 
 
 def _latest_complete_pairs(
@@ -120,27 +133,24 @@ def extract_annual_data(
         disc_date = record.get("DiscDate", "")
 
         if disc_date:
-            try:
-                disc_dt = parse_date_string(disc_date)
-                if disc_dt and disc_dt > today:
-                    return False
-            except (ValueError, TypeError):
-                pass
+            disc_dt = parse_date_string(disc_date)
+            if disc_dt and disc_dt > today:
+                return False
 
         if fy_end:
-            year, month = extract_year_month(fy_end)
-            if year is None or month is None:
-                return True
-            try:
-                fy_end_dt = parse_date_string(fy_end)
-                if fy_end_dt and fy_end_dt > today:
-                    return False
-            except (ValueError, TypeError):
-                if year > today.year or (year == today.year and month > today.month):
+            # 定型日付は（メモ化された）parse_date_string 1回で未来判定する。
+            # 解析できない形式だけ年月の抽出を試み、それも失敗したら判定対象外として残す
+            fy_end_dt = parse_date_string(fy_end)
+            if fy_end_dt is not None:
+                if fy_end_dt > today:
                     return False
+            else:
+                year, month = extract_year_month(fy_end)
+                if year is None or month is None:
+                    return True
 
         if not is_valid_financial_record(record):
-            logger.warning(f"主要財務データが全てN/Aのため除外: fy_end={fy_end}")
+            logger.warning("主要財務データが全てN/Aのため除外: fy_end=%s", fy_end)
             return False
 
         return True
@@ -172,6 +182,71 @@ def extract_annual_data(
 
 
 
+# 半期データで扱うフロー項目（_make_half_data の位置引数順）
+_HALF_FLOW_FIELDS = ("Sales", "OP", "NP", "CFO", "CFI")
+
+
+def _flow_millions(record: dict[str, Any]) -> list[float | None]:
+    """レコードのフロー項目を百万円単位で返す。"""
+    return [to_float_millions(record.get(field)) for field in _HALF_FLOW_FIELDS]
+
+
+def _flow_diff_millions(fy_rec: dict[str, Any], q2_rec: dict[str, Any]) -> list[float | None]:
+    """FY − 2Q（下半期単独）のフロー項目を百万円単位で返す。どちらかが欠損なら None。"""
+    diffs: list[float | None] = []
+    for field in _HALF_FLOW_FIELDS:
+        fy_v = to_float(fy_rec.get(field))
+        q2_v = to_float(q2_rec.get(field))
+        diffs.append((fy_v - q2_v) / MILLION_YEN if fy_v is not None and q2_v is not None else None)
+    return diffs
+
+
+def _record_source(record: dict[str, Any] | None) -> str:
+    return "edinet" if record and record.get("_xbrl_source") else "external"
+
+
+def _make_half_data(
+    sales: float | None,
+    op: float | None,
+    np_: float | None,
+    cfo: float | None,
+    cfi: float | None,
+    *,
+    source: str,
+    flow_method: str | None = None,
+) -> dict[str, Any]:
+    cfc = (cfo + cfi) if cfo is not None and cfi is not None else None
+    metric_source = {"source": source, "unit": "million_yen"}
+    flow_source = {"source": source, "unit": "million_yen"}
+    if flow_method is not None:
+        flow_source = {"source": "derived", "unit": "million_yen", "method": flow_method}
+    return {
+        "Sales": sales,
+        "OP": op,
+        "OperatingMargin": op / sales * 100 if op is not None and sales else None,
+        "NP": np_,
+        "CFO": cfo,
+        "CFI": cfi,
+        "CFC": cfc,
+        "FreeCF": cfc,
+        "MetricSources": {
+            "Sales": metric_source.copy(),
+            "OP": metric_source.copy(),
+            "OperatingMargin": {"source": "derived", "method": "OP / Sales", "unit": "percent"},
+            "NP": metric_source.copy(),
+            "CFO": flow_source.copy(),
+            "CFI": flow_source.copy(),
+            "CFC": {"source": "derived", "method": "CFO + CFI", "unit": "million_yen"},
+            "FreeCF": {"source": "derived", "method": "alias of CFC", "unit": "million_yen"},
+        },
+    }
+
+
+def _label_year(fy_end: str) -> str:
+    s = fy_end.replace("-", "")
+    return s[2:4] if len(s) >= 4 else s[:2]
+
+
 def build_half_year_periods(
     financial_data: list[dict[str, Any]],
     years: int = 3,
@@ -247,60 +322,6 @@ def build_half_year_periods(
 
     fy_ends_selected = sorted(set(fy_ends_with_fy) | set(extra_q2_only), reverse=True)
 
-    def _m(value: str | float | int | None) -> float | None:
-        v = to_float(value)
-        return v / MILLION_YEN if v is not None else None
-
-    def _diff_m(fy_rec: dict[str, Any], q2_rec: dict[str, Any], field: str) -> float | None:
-        fy_v = to_float(fy_rec.get(field))
-        q2_v = to_float(q2_rec.get(field))
-        if fy_v is None or q2_v is None:
-            return None
-        return (fy_v - q2_v) / MILLION_YEN
-
-    def _record_source(record: dict[str, Any] | None) -> str:
-        return "edinet" if record and record.get("_xbrl_source") else "external"
-
-    def _make_data(
-        sales: float | None,
-        op: float | None,
-        np_: float | None,
-        cfo: float | None,
-        cfi: float | None,
-        *,
-        source: str,
-        flow_method: str | None = None,
-    ) -> dict[str, Any]:
-        cfc = (cfo + cfi) if cfo is not None and cfi is not None else None
-        metric_source = {"source": source, "unit": "million_yen"}
-        flow_source = {"source": source, "unit": "million_yen"}
-        if flow_method is not None:
-            flow_source = {"source": "derived", "unit": "million_yen", "method": flow_method}
-        return {
-            "Sales": sales,
-            "OP": op,
-            "OperatingMargin": op / sales * 100 if op is not None and sales else None,
-            "NP": np_,
-            "CFO": cfo,
-            "CFI": cfi,
-            "CFC": cfc,
-            "FreeCF": cfc,
-            "MetricSources": {
-                "Sales": metric_source.copy(),
-                "OP": metric_source.copy(),
-                "OperatingMargin": {"source": "derived", "method": "OP / Sales", "unit": "percent"},
-                "NP": metric_source.copy(),
-                "CFO": flow_source.copy(),
-                "CFI": flow_source.copy(),
-                "CFC": {"source": "derived", "method": "CFO + CFI", "unit": "million_yen"},
-                "FreeCF": {"source": "derived", "method": "alias of CFC", "unit": "million_yen"},
-            },
-        }
-
-    def _label_year(fy_end: str) -> str:
-        s = fy_end.replace("-", "")
-        return s[2:4] if len(s) >= 4 else s[:2]
-
     periods: list[dict[str, Any]] = []
     for fy_end in sorted(fy_ends_selected):  # 古い順
         fy_rec = fy_by_end.get(fy_end)
@@ -314,12 +335,8 @@ def build_half_year_periods(
                     "label": f"{yr}H1",
                     "half": "H1",
                     "fy_end": fy_end,
-                    "data": _make_data(
-                        _m(q2_rec.get("Sales")),
-                        _m(q2_rec.get("OP")),
-                        _m(q2_rec.get("NP")),
-                        _m(q2_rec.get("CFO")),
-                        _m(q2_rec.get("CFI")),
+                    "data": _make_half_data(
+                        *_flow_millions(q2_rec),
                         source=_record_source(q2_rec),
                     ),
                 })
@@ -331,12 +348,8 @@ def build_half_year_periods(
                 "label": f"{yr}H1",
                 "half": "H1",
                 "fy_end": fy_end,
-                "data": _make_data(
-                    _m(q2_rec.get("Sales")),
-                    _m(q2_rec.get("OP")),
-                    _m(q2_rec.get("NP")),
-                    _m(q2_rec.get("CFO")),
-                    _m(q2_rec.get("CFI")),
+                "data": _make_half_data(
+                    *_flow_millions(q2_rec),
                     source=_record_source(q2_rec),
                 ),
             })
@@ -344,12 +357,8 @@ def build_half_year_periods(
                 "label": f"{yr}H2",
                 "half": "H2",
                 "fy_end": fy_end,
-                "data": _make_data(
-                    _diff_m(fy_rec, q2_rec, "Sales"),
-                    _diff_m(fy_rec, q2_rec, "OP"),
-                    _diff_m(fy_rec, q2_rec, "NP"),
-                    _diff_m(fy_rec, q2_rec, "CFO"),
-                    _diff_m(fy_rec, q2_rec, "CFI"),
+                "data": _make_half_data(
+                    *_flow_diff_millions(fy_rec, q2_rec),
                     source="derived",
                     flow_method=f"FY {h2_method_source} - H1 {h2_method_source}",
                 ),
@@ -359,12 +368,8 @@ def build_half_year_periods(
                 "label": f"{yr}FY",
                 "half": None,
                 "fy_end": fy_end,
-                "data": _make_data(
-                    _m(fy_rec.get("Sales")),
-                    _m(fy_rec.get("OP")),
-                    _m(fy_rec.get("NP")),
-                    _m(fy_rec.get("CFO")),
-                    _m(fy_rec.get("CFI")),
+                "data": _make_half_data(
+                    *_flow_millions(fy_rec),
                     source=_record_source(fy_rec),
                 ),
             })
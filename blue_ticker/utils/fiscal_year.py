@@ -5,10 +5,39 @@
 """
 
 from datetime import datetime
+from functools import lru_cache
 
 from blue_ticker.constants.formats import DATE_LEN_COMPACT, DATE_LEN_HYPHENATED
 
 
+def parse_compact_date(date_str: str) -> datetime | None:
+    """YYYYMMDD を strptime を通さずに datetime へ変換する。定型外・不正日付は None。"""
+    if len(date_str) == DATE_LEN_COMPACT and date_str.isascii() and date_str.isdigit():
+        try:
+            return datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
+        except ValueError:
+            return None
+    return None
+
+
+def parse_hyphenated_date(date_part: str) -> datetime | None:
+    """YYYY-MM-DD（ゼロ埋め）を strptime を通さずに datetime へ変換する。定型外・不正日付は None。"""
+    if (
+        len(date_part) == DATE_LEN_HYPHENATED
+        and date_part.isascii()
+        and date_part[4] == "-"
+        and date_part[7] == "-"
+        and date_part[:4].isdigit()
+        and date_part[5:7].isdigit()
+        and date_part[8:].isdigit()
+    ):
+        try:
+            return datetime(int(date_part[:4]), int(date_part[5:7]), int(date_part[8:]))
+        except ValueError:
+            return None
+    return None
+
+
 def normalize_date_format(date_str: str | None) -> str | None:
     """
     日付文字列をYYYY-MM-DD形式に正規化
@@ -30,7 +59,8 @@ def normalize_date_format(date_str: str | None) -> str | None:
         elif len(date_str) >= DATE_LEN_HYPHENATED:
             # 最初の10文字を取得
             date_part = date_str[:10]
-            datetime.strptime(date_part, "%Y-%m-%d")
+            if parse_hyphenated_date(date_part) is None:
+                datetime.strptime(date_part, "%Y-%m-%d")
             return date_part
         # YYYY形式のみ
         elif len(date_str) == 4 and date_str.isdigit():
@@ -126,9 +156,13 @@ def extract_fiscal_year_number(fy_end: str | None) -> int | None:
     return calculate_fiscal_year(fy_end)
 
 
+@lru_cache(maxsize=4096)
 def parse_date_string(date_str: str | None) -> datetime | None:
     """
     日付文字列をdatetimeオブジェクトに変換
+
+    年度終了日・開示日は銘柄・期間をまたいで同じ値が繰り返されるため、結果をメモ化する
+    （datetime は不変なので共有しても安全）。
     
     Args:
         date_str: 日付文字列（YYYY-MM-DD、YYYYMMDD、またはその他の形式）
@@ -142,10 +176,11 @@ def parse_date_string(date_str: str | None) -> datetime | None:
     try:
         # YYYYMMDD形式
         if len(date_str) == DATE_LEN_COMPACT and date_str.isdigit():
-            return datetime.strptime(date_str, "%Y%m%d")
-        # YYYY-MM-DD形式
+            return parse_compact_date(date_str)
+        # YYYY-MM-DD形式（定型は直接組み立て、それ以外は strptime で判定）
         elif len(date_str) >= DATE_LEN_HYPHENATED:
-            return datetime.strptime(date_str[:10], "%Y-%m-%d")
+            date_part = date_str[:10]
+            return parse_hyphenated_date(date_part) or datetime.strptime(date_part, "%Y-%m-%d")
     except (ValueError, TypeError):
         pass
     
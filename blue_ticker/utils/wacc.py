@@ -10,6 +10,7 @@ import io
 import logging
 import re
 import ssl
+import time
 import urllib.request
 from datetime import date, timedelta
 
@@ -21,21 +22,25 @@ from blue_ticker.constants.financial import (
     WACC_MARKET_RISK_PREMIUM,
     WACC_RF_FALLBACK,
 )
+from blue_ticker.utils.fiscal_year import normalize_date_format
 
 logger = logging.getLogger(__name__)
 
 _MOF_JGB_CACHE_KEY = "mof_rf_rates"
 _MOF_JGB_CACHE_TTL_DAYS = 1
+# プロセス内メモ（cache_dir → (読込時の monotonic 秒, rates)）。続けて複数銘柄を分析しても全履歴の JSON を毎回読まない
+_rf_rates_memo: dict[str, tuple[float, dict[str, float]]] = {}
+_MOF_DATE_RE = re.compile(r'^([SRHT])(\d+)\.(\d+)\.(\d+)$')
+_MOF_ERA_OFFSETS = {'S': 1925, 'H': 1988, 'R': 2018, 'T': 1911}
 
 
 def _parse_mof_date(date_str: str) -> str | None:
     """和暦日付 (R8.4.23, H31.3.31, S49.9.24) → YYYY-MM-DD。解析失敗時は None。"""
-    m = re.match(r'^([SRHT])(\d+)\.(\d+)\.(\d+)$', date_str.strip())
+    m = _MOF_DATE_RE.match(date_str.strip())
     if not m:
         return None
     era, yr, mo, dy = m.group(1), int(m.group(2)), int(m.group(3)), int(m.group(4))
-    offsets = {'S': 1925, 'H': 1988, 'R': 2018, 'T': 1911}
-    return f"{yr + offsets[era]:04d}-{mo:02d}-{dy:02d}"
+    return f"{yr + _MOF_ERA_OFFSETS[era]:04d}-{mo:02d}-{dy:02d}"
 
 
 def _fetch_csv_rates(url: str) -> dict[str, float]:
@@ -76,16 +81,21 @@ def _fetch_csv_rates(url: str) -> dict[str, float]:
 def load_rf_rates(cache_dir: str) -> dict[str, float]:
     """MOF CSV から {YYYY-MM-DD: 10年利回り(小数)} の全履歴を返す（1日キャッシュ）。
     jgbcm_all.csv（前月末まで）と jgbcm.csv（当月分）をマージして返す。
-    両方失敗した場合は空 dict を返す。
+    両方失敗した場合は空 dict を返す（失敗はメモせず次回また取得を試みる）。
     """
     from blue_ticker import __version__
     from blue_ticker.utils.cache import CacheManager
     from blue_ticker.constants.api import MOF_JGB_ALL_CSV_URL, MOF_JGB_CURRENT_CSV_URL
 
+    memo = _rf_rates_memo.get(cache_dir)
+    if memo is not None and time.monotonic() - memo[0] < timedelta(days=_MOF_JGB_CACHE_TTL_DAYS).total_seconds():
+        return memo[1]
+
     _CACHE_VERSION = __version__
     cache = CacheManager(cache_dir=cache_dir, ttl_days=_MOF_JGB_CACHE_TTL_DAYS)
     cached = cache.get(_MOF_JGB_CACHE_KEY)
     if cached and cached.get("_cache_version") == _CACHE_VERSION:
+        _rf_rates_memo[cache_dir] = (time.monotonic(), cached["rates"])
         return cached["rates"]
 
     rates: dict[str, float] = {}
@@ -100,6 +110,7 @@ def load_rf_rates(cache_dir: str) -> dict[str, float]:
 
     if rates:
         cache.set(_MOF_JGB_CACHE_KEY, {"_cache_version": _CACHE_VERSION, "rates": rates})
+        _rf_rates_memo[cache_dir] = (time.monotonic(), rates)
     return rates
 
 
@@ -107,11 +118,17 @@ def resolve_rf_for_date(rates: dict[str, float], fy_end: str) -> tuple[float, st
     """FY終了日に対応するRfと出所を返す。
     その日が休日等で存在しなければ最大14日遡って直前値を探す。
     見つからなければ WACC_RF_FALLBACK と "fallback" を返す。
+    fy_end は YYYYMMDD / YYYY-MM-DD のどちらでもよく、rates のキー形式
+    （YYYY-MM-DD）へ1回だけ正規化してから引く。
     """
-    if fy_end in rates:
-        return rates[fy_end], "mof"
+    fy_end_key = normalize_date_format(fy_end)
+    if fy_end_key is None:
+        return WACC_RF_FALLBACK, "fallback"
+    rate = rates.get(fy_end_key)
+    if rate is not None:
+        return rate, "mof"
     try:
-        target = date.fromisoformat(fy_end)
+        target = date.fromisoformat(fy_end_key)
     except ValueError:
         return WACC_RF_FALLBACK, "fallback"
     for days_back in range(1, 15):
@@ -538,6 +538,13 @@ class TestApplyWacc:
         assert cd["MetricSources"]["CostOfEquity"]["rf"] == 0.01
         assert cd["MetricSources"]["CostOfEquity"]["rf_source"] == "mof"
 
+    def test_compact_fy_end_matches_mof_rate_on_same_day(self):
+        years = [_make_year("20240331", NetAssets=800.0)]
+        _apply_wacc(years, {"2024-03-29": 0.02, "2024-03-31": 0.01})
+        source = cast(dict[str, Any], years[0]["CalculatedData"].get("MetricSources", {}).get("CostOfEquity"))
+        assert source["rf"] == 0.01
+        assert source["rf_source"] == "mof"
+
     def test_no_ibd_wacc_equals_cost_of_equity(self):
         """無借金: WACC = CostOfEquity"""
         years = [_make_year("2024-03-31", NetAssets=800.0)]
@@ -43,6 +43,29 @@ def test_prune_edinet_by_age(tmp_path) -> None:
     assert new_xbrl.exists()
 
 
+def test_search_validators_are_not_counted_as_search_cache(tmp_path) -> None:
+    from blue_ticker.api.edinet_cache_store import EdinetCacheStore
+    from blue_ticker.utils.cache_paths import edinet_cache_dir
+
+    store = EdinetCacheStore(edinet_cache_dir(tmp_path))
+    filename = store.search_cache_key("2024-01-01")
+    store.save_search_cache(filename, [])
+    store.save_search_cache_validators(filename, {"etag": '"abc"'})
+    validators_path = store.search_validators_dir / filename
+    assert validators_path.exists()
+    _touch_old(store.documents_by_date_dir / filename, 40)
+
+    pruner = CachePruner(tmp_path)
+    assert pruner.stats().edinet_search_files == 1
+    assert pruner.audit().edinet_search_files == ["search_2024-01-01.json"]
+
+    summary = pruner.prune(dry_run=False, edinet_search_days=30)
+
+    assert summary.removed_files == 1
+    assert not (store.documents_by_date_dir / filename).exists()
+    assert not validators_path.exists()
+
+
 def test_prune_edinet_doc_indexes_keeps_recent_years_by_default(tmp_path) -> None:
     current_year = datetime.now().year
     edinet_dir = tmp_path / "edinet"
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Any, cast
 
 from blue_ticker.analysis.calculator import calculate_metrics_flexible
@@ -152,3 +153,42 @@ def test_calculated_eps_bps_are_exposed_as_verification_values():
     assert current_calc["MetricSources"]["AverageShares"]["statement"] == "notes"
     assert current_calc["MetricSources"]["CalculatedEPS"]["method"] == "NP / AverageShares"
     assert current_calc["MetricSources"]["CalculatedEPS"]["statement"] == "consolidated"
+
+
+def test_cash_eq_falls_back_in_priority_order():
+    metrics = calculate_metrics_flexible(
+        [
+            {
+                "CurFYEn": "2024-03-31",
+                "CurPerType": "FY",
+                "Sales": 1_000_000_000,
+                "CashEq": "2,000,000",
+                "Cash": 3_000_000,
+            },
+            {
+                "CurFYEn": "2023-03-31",
+                "CurPerType": "FY",
+                "Sales": 900_000_000,
+                "Cash": 4_000_000,
+            },
+        ],
+        analysis_years=2,
+    )
+
+    years = metrics.get("years")
+    assert years is not None
+    assert years[0]["RawData"].get("CashEq") == 2_000_000
+    assert years[1]["RawData"].get("CashEq") == 4_000_000
+
+
+def test_future_fiscal_year_is_excluded_relative_to_today():
+    annual_data = [
+        {"CurFYEn": "2025-03-31", "CurPerType": "FY", "Sales": 1_100_000_000},
+        {"CurFYEn": "2024-03-31", "CurPerType": "FY", "Sales": 1_000_000_000},
+    ]
+
+    metrics = calculate_metrics_flexible(annual_data, analysis_years=2, today=datetime(2025, 2, 28))
+
+    years = metrics.get("years")
+    assert years is not None
+    assert [y["fy_end"] for y in years] == ["2024-03-31"]
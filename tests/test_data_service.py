@@ -551,6 +551,22 @@ class TestExtractFilingContent:
             "sections": None,
         }
 
+    @pytest.mark.asyncio
+    async def test_segment_sections_are_served_from_cache_without_download(self, svc, tmp_path):
+        segments = {"method": "not_found", "tables": [], "facts": []}
+        svc.filing_service.edinet_client = AsyncMock()
+        svc.filing_service.edinet_client.download_document.return_value = tmp_path
+        with patch.dict(
+            "blue_ticker.services.filing_service._SECTION_EXTRACTORS",
+            {"segments": lambda _dir: segments},
+        ):
+            first = await svc.filing_service.extract_filing_content("72030", doc_id="S100SEG", sections=["segments"])
+            second = await svc.filing_service.extract_filing_content("72030", doc_id="S100SEG", sections=["segments"])
+
+        assert first["sections"] == {"segments": segments}
+        assert second["sections"] == {"segments": segments}
+        svc.filing_service.edinet_client.download_document.assert_awaited_once_with("S100SEG", 1)
+
 
 # ──────────────────────────────────────────────────────────────
 # HalfYearDataService
@@ -155,6 +155,19 @@ class TestDeduplication(unittest.TestCase):
         self.assertEqual(by_type["2Q"]["NP"], 40)
         self.assertEqual(by_type["2Q"]["DiscDate"], "2024-11-21")
 
+    def test_merge_does_not_mutate_input_records(self):
+        first = {"CurFYEn": "2025-03-31", "CurPerType": "FY", "DiscDate": "2025-05-14", "Sales": 1000, "NP": 100}
+        second = {"CurFYEn": "2025-03-31", "CurPerType": "FY", "DiscDate": "2025-05-21", "NP": 120}
+        first_before = dict(first)
+        second_before = dict(second)
+
+        result = extract_annual_data([first, second])
+
+        self.assertEqual(result[0]["NP"], 120)
+        self.assertEqual(result[0]["Sales"], 1000)
+        self.assertEqual(first, first_before)
+        self.assertEqual(second, second_before)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import time
@@ -6,6 +7,8 @@ from datetime import datetime, timedelta
 from io import BytesIO
 from pathlib import Path
 
+import pytest
+
 from blue_ticker.api.edinet_cache_store import EdinetCacheStore
 
 
@@ -172,6 +175,27 @@ def test_document_index_can_allow_stale_built_through(tmp_path):
     assert store.load_document_index(2024, required_through="2024-12-31", allow_stale=True) == documents
 
 
+def test_document_index_reuses_parsed_payload_until_file_changes(tmp_path, monkeypatch):
+    store = EdinetCacheStore(tmp_path)
+    store.save_document_index(2024, [{"docID": "OLD"}], built_through="2024-12-31")
+    assert store.load_document_index(2024) == [{"docID": "OLD"}]
+
+    parse_calls: list[bytes] = []
+    real_loads = json.loads
+    monkeypatch.setattr(
+        "blue_ticker.api.edinet_cache_store.json.loads",
+        lambda raw: parse_calls.append(raw) or real_loads(raw),
+    )
+    assert store.load_document_index(2024) == [{"docID": "OLD"}]
+    assert parse_calls == []
+
+    other_process_store = EdinetCacheStore(tmp_path)
+    other_process_store.save_document_index(2024, [{"docID": "NEW"}, {"docID": "NEW2"}], built_through="2024-12-31")
+
+    assert store.load_document_index(2024) == [{"docID": "NEW"}, {"docID": "NEW2"}]
+    assert len(parse_calls) == 1
+
+
 def test_store_xbrl_zip_evicts_oldest_dirs_when_over_limit(tmp_path):
     store = EdinetCacheStore(tmp_path, max_xbrl_bytes=100)
     base_ts = datetime.now().timestamp() - 100
@@ -277,3 +301,39 @@ def test_file_lock_prints_wait_notice(tmp_path, monkeypatch, capsys):
     captured = capsys.readouterr()
     assert "別のblue_tickerプロセスの完了を待っています" in captured.err
     assert "処理を続行します" in captured.err
+
+
+def test_store_xbrl_zip_extracts_without_writing_zip_file_or_images(tmp_path):
+    store = EdinetCacheStore(tmp_path)
+
+    dest = store.store_xbrl_zip(
+        "DOC1",
+        _make_xbrl_zip({"XBRL/a.txt": b"1234", "XBRL/PublicDoc/images/chart.PNG": b"img"}),
+    )
+
+    assert (dest / "XBRL" / "a.txt").read_bytes() == b"1234"
+    assert not (dest / "XBRL" / "PublicDoc" / "images" / "chart.PNG").exists()
+    assert not list(store.xbrl_root_dir.glob("*.zip"))
+
+
+@pytest.mark.asyncio
+async def test_async_file_lock_lets_same_process_holder_finish(tmp_path, monkeypatch):
+    store = EdinetCacheStore(tmp_path)
+    monkeypatch.setattr("blue_ticker.api.edinet_cache_store.EDINET_CACHE_LOCK_POLL_SECONDS", 0.001)
+    order: list[str] = []
+
+    async def holder() -> None:
+        async with store.async_file_lock("documents_by_date_2024-06-24"):
+            order.append("holder-start")
+            await asyncio.sleep(0.01)
+            order.append("holder-end")
+
+    async def waiter() -> None:
+        await asyncio.sleep(0)
+        async with store.async_file_lock("documents_by_date_2024-06-24"):
+            order.append("waiter")
+
+    await asyncio.gather(holder(), waiter())
+
+    assert order == ["holder-start", "holder-end", "waiter"]
+    assert not list(store.locks_dir.glob("*.lock"))
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import AbstractContextManager, nullcontext
 from datetime import date, timedelta
 from pathlib import Path
@@ -6,8 +7,18 @@ from typing import Any
 import pytest
 
 from blue_ticker.api.edinet_cache_backend import EdinetCacheBackend
+from blue_ticker.constants.api import (
+    EDINET_CONCURRENCY_RECOVERY_SUCCESSES,
+    EDINET_DOCUMENT_INDEX_BATCH_SIZE,
+    EDINET_RETRY_BACKOFF_CAP_SECONDS,
+)
 from blue_ticker.api.edinet_cache_store import EdinetCacheStore
-from blue_ticker.api.edinet_client import EdinetAPIClient, _resolve_ca_bundle_file
+from blue_ticker.api.edinet_client import (
+    EdinetAPIClient,
+    _AdaptiveConcurrencyLimiter,
+    _backoff_seconds,
+    _resolve_ca_bundle_file,
+)
 
 
 class _FakeEdinetClient(EdinetAPIClient):
@@ -26,12 +37,14 @@ class _FailingRequestClient(EdinetAPIClient):
         super().__init__(api_key=api_key, cache_store=cache_store)
         self.request_calls = 0
 
-    async def _request(
+    async def _request_json(
         self,
         endpoint: str,
         params: dict[str, Any] | None = None,
         max_retries: int = 3,
-    ) -> dict[str, Any]:
+        *,
+        validators: dict[str, str] | None = None,
+    ) -> tuple[dict[str, Any] | None, dict[str, str]]:
         self.request_calls += 1
         raise RuntimeError("edinet down")
 
@@ -165,6 +178,16 @@ def test_resolve_ca_bundle_ignores_missing_ssl_cert_file_env(tmp_path, monkeypat
     assert _resolve_ca_bundle_file() == ca_file
 
 
+def test_backoff_seconds_uses_full_jitter_within_cap(monkeypatch) -> None:
+    monkeypatch.setattr("blue_ticker.api.edinet_client.random.uniform", lambda low, high: high)
+    assert _backoff_seconds(1) == 2
+    assert _backoff_seconds(3) == 8
+    assert _backoff_seconds(20) == EDINET_RETRY_BACKOFF_CAP_SECONDS
+
+    monkeypatch.setattr("blue_ticker.api.edinet_client.random.uniform", lambda low, high: low)
+    assert _backoff_seconds(3) == 0
+
+
 @pytest.mark.asyncio
 async def test_document_index_builds_year_cache_with_low_parallel_fetch(tmp_path) -> None:
     store = EdinetCacheStore(tmp_path)
@@ -227,6 +250,25 @@ async def test_get_documents_for_date_range_uses_year_index_for_wide_ranges(tmp_
     assert client.fetch_dates == []
 
 
+@pytest.mark.asyncio
+async def test_overlapping_index_ranges_share_one_grouping_by_date(tmp_path) -> None:
+    store = EdinetCacheStore(tmp_path)
+    store.save_document_index(
+        2024,
+        [{"docID": "IN", "submitDateTime": "2024-06-24 10:00", "_edinet_list_date": "2024-06-24"}],
+        built_through="2024-12-31",
+    )
+    client = _FakeEdinetClient(store, {})
+
+    first = await client.get_documents_for_date_range(date(2024, 6, 1), date(2024, 6, 30))
+    grouping = client._document_index_views[2024].by_date
+    first["2024-06-24"][0]["fiscal_year"] = 2023
+    second = await client.get_documents_for_date_range(date(2024, 5, 20), date(2024, 7, 10))
+
+    assert client._document_index_views[2024].by_date is grouping
+    assert second["2024-06-24"] == [{"docID": "IN", "submitDateTime": "2024-06-24 10:00"}]
+
+
 @pytest.mark.asyncio
 async def test_documents_for_date_prefers_stale_search_cache(tmp_path) -> None:
     store = EdinetCacheStore(tmp_path, search_hit_ttl_days=0)
@@ -278,3 +320,177 @@ async def test_document_index_catchup_fetches_only_missing_dates(tmp_path) -> No
     assert client.fetch_dates == [today.strftime("%Y-%m-%d")]
     assert cached_info is not None
     assert cached_info["built_through"] == today.strftime("%Y-%m-%d")
+
+
+@pytest.mark.asyncio
+async def test_daily_range_fetch_is_bounded_and_keeps_date_order(tmp_path) -> None:
+    class _SlowClient(_FakeEdinetClient):
+        def __init__(self, cache_store: EdinetCacheStore) -> None:
+            super().__init__(cache_store, {})
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def _get_documents_for_date(self, date_str: str) -> list[dict[str, Any]]:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.001 if date_str.endswith("1") else 0)
+            self.in_flight -= 1
+            return [{"docID": date_str}]
+
+    client = _SlowClient(EdinetCacheStore(tmp_path))
+
+    docs_by_date = await client.get_documents_for_date_range(
+        date(2024, 6, 1),
+        date(2024, 6, 10),
+        use_index=False,
+    )
+
+    assert list(docs_by_date) == [f"2024-06-{day:02d}" for day in range(1, 11)]
+    assert all(docs == [{"docID": list_date}] for list_date, docs in docs_by_date.items())
+    assert client.max_in_flight == EDINET_DOCUMENT_INDEX_BATCH_SIZE
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_halves_once_per_throttle_burst_and_recovers() -> None:
+    limiter = _AdaptiveConcurrencyLimiter(10)
+
+    for _ in range(5):
+        limiter.record_throttled()
+    assert limiter.limit == 5
+
+    for _ in range(EDINET_CONCURRENCY_RECOVERY_SUCCESSES):
+        limiter.record_success()
+    assert limiter.limit == 6
+
+    limiter.limit = 1
+    active = 0
+    peak = 0
+
+    async def run() -> None:
+        nonlocal active, peak
+        async with limiter:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+
+    await asyncio.gather(*[run() for _ in range(4)])
+    assert peak == 1
+
+
+class _ConditionalRequestClient(EdinetAPIClient):
+    def __init__(self, cache_store: EdinetCacheStore) -> None:
+        super().__init__(api_key="dummy", cache_store=cache_store)
+        self.sent_validators: list[dict[str, str] | None] = []
+
+    async def _request_json(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        max_retries: int = 3,
+        *,
+        validators: dict[str, str] | None = None,
+    ) -> tuple[dict[str, Any] | None, dict[str, str]]:
+        self.sent_validators.append(validators)
+        if validators and validators.get("etag") == '"v1"':
+            return None, validators
+        return {"results": [{"docID": "FRESH"}]}, {"etag": '"v2"'}
+
+
+@pytest.mark.asyncio
+async def test_expired_date_cache_is_revalidated_with_conditional_get(tmp_path) -> None:
+    store = EdinetCacheStore(tmp_path, search_hit_ttl_days=0)
+    today = date.today().isoformat()
+    filename = store.search_cache_key(today)
+    store.save_search_cache(filename, [{"docID": "CACHED"}])
+    store.save_search_cache_validators(filename, {"etag": '"v1"'})
+    client = _ConditionalRequestClient(store)
+
+    assert await client._get_documents_for_date(today) == [{"docID": "CACHED"}]
+    assert client.sent_validators == [{"etag": '"v1"'}]
+
+    store.save_search_cache_validators(filename, {"etag": '"old"'})
+    assert await client._get_documents_for_date(today) == [{"docID": "FRESH"}]
+    assert store.load_search_cache(filename, allow_expired=True) == [{"docID": "FRESH"}]
+    assert store.load_search_cache_validators(filename) == {"etag": '"v2"'}
+
+
+class _SlowDateClient(_FakeEdinetClient):
+    async def _get_documents_for_date(self, date_str: str) -> list[dict[str, Any]]:
+        self.fetch_dates.append(date_str)
+        await asyncio.sleep(0)
+        return self.docs_by_date.get(date_str, [])
+
+
+@pytest.mark.asyncio
+async def test_find_latest_document_stops_fetching_older_dates_after_hit(tmp_path) -> None:
+    client = _SlowDateClient(
+        EdinetCacheStore(tmp_path),
+        {
+            "2024-06-20": [{"docID": "OLDER", "docTypeCode": "120"}],
+            "2024-06-28": [{"docID": "NEWEST", "docTypeCode": "120"}],
+        },
+    )
+
+    doc = await client.find_latest_document(
+        date(2024, 6, 1),
+        date(2024, 6, 28),
+        lambda d: d.get("docTypeCode") == "120",
+    )
+
+    assert doc is not None and doc["docID"] == "NEWEST"
+    assert client.fetch_dates[0] == "2024-06-28"
+    assert len(client.fetch_dates) <= EDINET_DOCUMENT_INDEX_BATCH_SIZE + 1
+
+
+@pytest.mark.asyncio
+async def test_find_latest_document_uses_sec_code_group_of_year_index(tmp_path) -> None:
+    store = EdinetCacheStore(tmp_path)
+    store.save_document_index(
+        2024,
+        [
+            {"docID": "OLD", "secCode": "72030", "docTypeCode": "120", "_edinet_list_date": "2024-05-10"},
+            {"docID": "OTHER", "secCode": "67580", "docTypeCode": "120", "_edinet_list_date": "2024-06-25"},
+            {"docID": "NEW", "secCode": "72030", "docTypeCode": "120", "_edinet_list_date": "2024-06-24"},
+            {"docID": "LATE", "secCode": "72030", "docTypeCode": "120", "_edinet_list_date": "2024-09-01"},
+        ],
+        built_through="2024-12-31",
+    )
+    client = _FakeEdinetClient(store, {})
+
+    doc = await client.find_latest_document(
+        date(2024, 5, 1),
+        date(2024, 7, 31),
+        lambda d: d.get("docTypeCode") == "120",
+        sec_code_prefix="7203",
+    )
+
+    assert doc == {"docID": "NEW", "secCode": "72030", "docTypeCode": "120"}
+    assert client.fetch_dates == []
+
+
+@pytest.mark.asyncio
+async def test_find_documents_copies_only_matching_index_documents_in_date_order(tmp_path) -> None:
+    store = EdinetCacheStore(tmp_path)
+    store.save_document_index(
+        2024,
+        [
+            {"docID": "A2", "docTypeCode": "130", "_edinet_list_date": "2024-06-24"},
+            {"docID": "SKIP", "docTypeCode": "120", "_edinet_list_date": "2024-06-24"},
+            {"docID": "A1", "docTypeCode": "130", "_edinet_list_date": "2024-03-01"},
+        ],
+        built_through="2024-12-31",
+    )
+    client = _FakeEdinetClient(store, {})
+
+    def is_amendment(doc: dict[str, Any]) -> bool:
+        return doc.get("docTypeCode") == "130"
+
+    oldest_first = await client.find_documents(date(2024, 1, 1), date(2024, 12, 31), is_amendment)
+    newest_first = await client.find_documents(
+        date(2024, 1, 1), date(2024, 12, 31), is_amendment, newest_first=True
+    )
+
+    assert [doc["docID"] for doc in oldest_first] == ["A1", "A2"]
+    assert [doc["docID"] for doc in newest_first] == ["A2", "A1"]
+    assert all("_edinet_list_date" not in doc for doc in oldest_first)
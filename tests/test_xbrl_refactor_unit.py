@@ -67,5 +67,127 @@ class TestXBRLParserRefactor(unittest.TestCase):
         for section_id in XBRL_SECTIONS.keys():
             self.assertIn(section_id, sections)
 
+    def test_extract_section_from_inline_xbrl_html(self):
+        """見出しから次の見出しまでの本文を抽出できるかテスト"""
+        (self.xbrl_path / "0101010_honbun_ixbrl.htm").write_text(
+            """<html><body><div>
+<h2>【事業の内容】</h2><p>当社は産業機械を製造しています。</p><p>主要な製品は工作機械です。</p>
+<h2>【関係会社の状況】</h2><p>連結子会社は3社です。</p>
+</div></body></html>""",
+            encoding="utf-8",
+        )
+        text = self.parser.extract_section(self.xbrl_path, "事業の内容")
+        self.assertEqual(text, "当社は産業機械を製造しています。\n主要な製品は工作機械です。")
+        self.assertIsNone(self.parser.extract_section(self.xbrl_path, "存在しない項目"))
+
+    def test_extract_section_keeps_table_and_list_siblings_of_heading(self):
+        """見出しの兄弟として置かれた表やリストの本文も抽出されるかテスト"""
+        (self.xbrl_path / "0101010_honbun_ixbrl.htm").write_text(
+            """<html><head><title>t</title></head><body>
+<h2>【事業の内容】</h2><p>主要な製品は次のとおりです。</p>
+<table><tr><td>工作機械</td><td>100</td></tr></table>
+<ul><li>産業用ロボット</li></ul>
+<h2>【関係会社の状況】</h2><p>連結子会社は3社です。</p>
+</body></html>""",
+            encoding="utf-8",
+        )
+        text = self.parser.extract_section(self.xbrl_path, "事業の内容")
+        self.assertEqual(text, "主要な製品は次のとおりです。\n工作機械100\n産業用ロボット")
+
+    def test_extract_section_keeps_bare_text_and_inline_tags_between_headings(self):
+        """見出し間の地の文やインライン要素（b, font, ix:nonNumeric 等）の本文も抽出されるかテスト"""
+        (self.xbrl_path / "0101010_honbun_ixbrl.htm").write_text(
+            """<html><body>
+<h3>【事業の内容】</h3>本文テキスト<b>強調</b><br/><font>フォント</font>
+<ix:nonNumeric name="jpcrp_cor:DescriptionOfBusinessTextBlock">インライン本文</ix:nonNumeric>
+<h3>【関係会社の状況】</h3><p>連結子会社は3社です。</p>
+</body></html>""",
+            encoding="utf-8",
+        )
+        text = self.parser.extract_section(self.xbrl_path, "事業の内容")
+        self.assertEqual(text, "本文テキスト\n強調\nフォント\nインライン本文")
+
+    def test_extract_section_finds_title_written_as_character_references(self):
+        """項目名が文字参照で書かれたファイルも読み飛ばさずに抽出できるかテスト"""
+        (self.xbrl_path / "0101010_honbun_ixbrl.htm").write_text(
+            "<html><body><h2>【事業の内容】</h2><p>本文A</p></body></html>", encoding="utf-8"
+        )
+        (self.xbrl_path / "0102010_honbun_ixbrl.htm").write_text(
+            "<html><body><h2>&#x3010;&#x4E8B;&#x696D;&#x306E;&#x72B6;&#x6CC1;&#x3011;</h2><p>本文B</p></body></html>",
+            encoding="utf-8",
+        )
+        self.assertEqual(self.parser.extract_section(self.xbrl_path, "事業の状況"), "本文B")
+
+    def test_extract_section_finds_title_split_by_inline_markup(self):
+        """項目名がインライン要素で分断されたファイルも読み飛ばさずに抽出できるかテスト"""
+        (self.xbrl_path / "0101010_honbun_ixbrl.htm").write_text(
+            "<html><body><h2>【事業<span>の</span>内容】</h2><p>本文A</p></body></html>", encoding="utf-8"
+        )
+        self.assertEqual(self.parser.extract_section(self.xbrl_path, "事業の内容"), "本文A")
+
+    def test_escaped_html_textblock_is_flattened_to_plain_text(self):
+        """エスケープされたHTML本文からタグを除去してテキスト化できるかテスト"""
+        (self.xbrl_path / "test_instance.xml").write_text(
+            """<?xml version="1.0" encoding="UTF-8"?>
+<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance" xmlns:jpcrp_cor="http://disclosure.edinet-fsa.go.jp/taxonomy/jpcrp/2022-11-01/jpcrp_cor">
+    <jpcrp_cor:ResearchAndDevelopmentActivitiesTextBlock>&lt;h3&gt;研究開発活動&lt;/h3&gt;
+&lt;p&gt;当連結会計年度の研究開発費の総額は&amp;nbsp;50億円です。&lt;/p&gt;&lt;p&gt;主に次世代電池および車載向け半導体の開発に注力しました。&lt;/p&gt;</jpcrp_cor:ResearchAndDevelopmentActivitiesTextBlock>
+</xbrli:xbrl>
+""",
+            encoding="utf-8",
+        )
+        sections = self.parser.extract_sections_by_type(self.xbrl_path)
+        self.assertEqual(
+            sections["research_and_development"],
+            "研究開発活動 当連結会計年度の研究開発費の総額は 50億円です。主に次世代電池および車載向け半導体の開発に注力しました。",
+        )
+
+    def test_reextracted_nested_instance_is_not_served_from_stale_cache(self):
+        """入れ子の PublicDoc 内のインスタンス文書を書き換えたら、同一プロセスでも新しい内容を返すかテスト"""
+        (self.xbrl_path / "test_instance.xml").unlink()
+        public_doc = self.xbrl_path / "XBRL" / "PublicDoc"
+        public_doc.mkdir(parents=True)
+        instance = public_doc / "jpcrp030000-asr-001.xbrl"
+        template = """<?xml version="1.0" encoding="UTF-8"?>
+<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance" xmlns:jpcrp_cor="http://disclosure.edinet-fsa.go.jp/taxonomy/jpcrp/2022-11-01/jpcrp_cor">
+    <jpcrp_cor:BusinessRisksTextBlock>{risk}当社グループの事業におけるリスクは以下の通りです。市場状況の変動により業績に影響を及ぼす可能性があります。</jpcrp_cor:BusinessRisksTextBlock>
+</xbrli:xbrl>
+"""
+        instance.write_text(template.format(risk="旧版。"), encoding="utf-8")
+        top_mtime_ns = self.xbrl_path.stat().st_mtime_ns
+        self.assertIn("旧版", self.parser.extract_sections_by_type(self.xbrl_path)["business_risks"])
+
+        instance.write_text(template.format(risk="改訂版の内容。"), encoding="utf-8")
+        # 展開ディレクトリ直下の mtime は変わらない
+        self.assertEqual(self.xbrl_path.stat().st_mtime_ns, top_mtime_ns)
+        self.assertIn("改訂版", self.parser.extract_sections_by_type(self.xbrl_path)["business_risks"])
+
+    def test_element_name_match_takes_precedence_over_title_match(self):
+        """要素名（部分一致含む）での一致が項目名での一致より優先されるかテスト"""
+        filler = "当社グループは各事業の特性に応じた管理体制を整備しております。" * 2
+        (self.xbrl_path / "test_instance.xml").write_text(
+            f"""<?xml version="1.0" encoding="UTF-8"?>
+<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance" xmlns:jpcrp_cor="http://disclosure.edinet-fsa.go.jp/taxonomy/jpcrp/2022-11-01/jpcrp_cor">
+    <jpcrp_cor:CorporateGovernanceTextBlock>事業等のリスクについては別項をご参照ください。{filler}</jpcrp_cor:CorporateGovernanceTextBlock>
+    <jpcrp_cor:BusinessRisksTextBlockCompanySpecific>為替変動リスクがあります。{filler}</jpcrp_cor:BusinessRisksTextBlockCompanySpecific>
+    <jpcrp_cor:OtherNotesTextBlock>【研究開発活動】基礎研究に注力しました。{filler}</jpcrp_cor:OtherNotesTextBlock>
+</xbrli:xbrl>
+""",
+            encoding="utf-8",
+        )
+        sections = self.parser.extract_sections_by_type(self.xbrl_path)
+        self.assertIn("為替変動リスク", sections["business_risks"])
+        self.assertTrue(sections["research_and_development"].startswith("研究開発活動 基礎研究に注力しました。"))
+
+    def test_section_text_is_normalized_to_start_with_title(self):
+        """項目名の括弧や前置きを外して項目名で始まるテキストに整形されるかテスト"""
+        ensure = self.parser._ensure_starts_with_section_title
+        self.assertEqual(ensure("２【事業の内容】 当社は機械を製造", "事業の内容"), "事業の内容 当社は機械を製造")
+        self.assertEqual(ensure("前置き 事業の内容】本文", "事業の内容"), "事業の内容 本文")
+        self.assertEqual(ensure("【事業の内容（連結）】本文", "事業の内容"), "事業の内容 本文")
+        self.assertEqual(ensure("前置き 事業の内容 本文", "事業の内容"), "事業の内容 本文")
+        self.assertEqual(ensure("本文のみ", "事業の内容"), "事業の内容 本文のみ")
+        self.assertEqual(ensure("  事業の内容本文 ", "事業の内容"), "事業の内容本文")
+
 if __name__ == "__main__":
     unittest.main()